@@ -10,7 +10,10 @@ This file demonstrates advanced usage patterns including:
 """
 
 import asyncio
+import io
 import os
+import sys
+from functools import partial
 from libraries_io_mcp.client import LibrariesIOClient
 from libraries_io_mcp.tools import (
     compare_packages,
@@ -22,223 +25,223 @@ from libraries_io_mcp.tools import (
     find_alternatives
 )
 
+# Section separator, hoisted so the string is built once per process
+_SEPARATOR = "\n" + "=" * 50 + "\n"
+
+# Read once at import; os.getenv does a dict lookup plus a string copy on
+# every call, and the key cannot change mid-run anyway
+_API_KEY = os.getenv("LIBRARIES_IO_API_KEY")
+
 async def main():
     """Advanced usage examples."""
-    
-    # Initialize client
-    api_key = os.getenv("LIBRARIES_IO_API_KEY")
-    if not api_key:
+
+    if not _API_KEY:
         print("Please set LIBRARIES_IO_API_KEY environment variable")
         return
-    
-    client = LibrariesIOClient(api_key=api_key)
-    
+
     print("=== Advanced Usage Examples ===\n")
-    
-    # Example 1: Compare packages
-    print("1. Comparing packages...")
-    try:
-        compare_result = await compare_packages(
-            packages=[
-                {"platform": "npm", "name": "react"},
-                {"platform": "npm", "name": "vue"},
-                {"platform": "npm", "name": "angular"}
-            ]
+
+    # Share one client (and its keep-alive connection pool) across all
+    # example calls, and close it when done. The calls are independent and
+    # I/O-bound, so run them concurrently and print the results afterwards;
+    # total wall-clock time is bounded by the slowest call instead of the
+    # sum of all of them.
+    async with LibrariesIOClient(api_key=_API_KEY) as client:
+        results = await asyncio.gather(
+            compare_packages(
+                packages=[
+                    {"platform": "npm", "name": "react"},
+                    {"platform": "npm", "name": "vue"},
+                    {"platform": "npm", "name": "angular"}
+                ]
+            ),
+            analyze_dependency_tree(platform="npm", name="react", max_depth=2),
+            check_package_security(platform="npm", name="react"),
+            check_license_compatibility(
+                licenses=["MIT", "Apache-2.0"],
+                use_case="commercial"
+            ),
+            find_alternatives(
+                platform="npm",
+                name="jquery",
+                criteria=["stars", "downloads", "recent_updates"]
+            ),
+            get_platform_stats(platform="npm", include_trending=True),
+            audit_project_dependencies(
+                platform="npm",
+                packages=[
+                    {"name": "react", "version": "^18.0.0"},
+                    {"name": "vue", "version": "^3.0.0"},
+                    {"name": "angular", "version": "^15.0.0"}
+                ],
+                check_duplicates=True,
+                check_outdated=True,
+                check_unused=False
+            ),
+            return_exceptions=True
         )
-        
-        if compare_result.success:
-            comparison = compare_result.data
-            print(f"Comparison of {len(comparison['packages'])} packages:")
-            for pkg in comparison['packages']:
-                print(f"  - {pkg['name']} ({pkg['platform']}):")
-                print(f"    Stars: {pkg.get('stars', 'N/A')}")
-                print(f"    Language: {pkg.get('language', 'N/A')}")
-                print(f"    Description: {pkg.get('description', 'N/A')[:100]}...")
-        else:
-            print(f"Comparison failed: {compare_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("\n" + "="*50 + "\n")
-    
+    (
+        compare_result, tree_result, security_result, license_result,
+        alternatives_result, stats_result, audit_result
+    ) = results
+
+    # Buffer the report and emit it with a single write instead of
+    # dozens of line-buffered print calls.
+    buf = io.StringIO()
+    report = partial(print, file=buf)
+
+    # Example 1: Compare packages
+    report("1. Comparing packages...")
+    if isinstance(compare_result, Exception):
+        report(f"Error: {compare_result}")
+    elif compare_result.success:
+        comparison = compare_result.data
+        report(f"Comparison of {len(comparison['packages'])} packages:")
+        for pkg in comparison['packages']:
+            report(f"  - {pkg['name']} ({pkg['platform']}):")
+            report(f"    Stars: {pkg.get('stars', 'N/A')}")
+            report(f"    Language: {pkg.get('language', 'N/A')}")
+            report(f"    Description: {pkg.get('description', 'N/A')[:100]}...")
+    else:
+        report(f"Comparison failed: {compare_result.error}")
+
+    report(_SEPARATOR)
+
     # Example 2: Analyze dependency tree
-    print("2. Analyzing dependency tree...")
-    try:
-        tree_result = await analyze_dependency_tree(
-            platform="npm",
-            name="react",
-            max_depth=2
-        )
-        
-        if tree_result.success:
-            tree = tree_result.data
-            print(f"Dependency tree for react (depth {tree['max_depth']}):")
-            print(f"Total dependencies: {tree['total_dependencies']}")
-            print(f"Runtime dependencies: {tree['runtime_dependencies']}")
-            print(f"Development dependencies: {tree['development_dependencies']}")
-            
-            print("\nTop dependencies:")
-            for dep in tree['top_dependencies'][:5]:
-                print(f"  - {dep['name']} ({dep['platform']}) - {dep['kind']}")
-        else:
-            print(f"Dependency tree analysis failed: {tree_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("\n" + "="*50 + "\n")
-    
+    report("2. Analyzing dependency tree...")
+    if isinstance(tree_result, Exception):
+        report(f"Error: {tree_result}")
+    elif tree_result.success:
+        tree = tree_result.data
+        report(f"Dependency tree for react (depth {tree['max_depth']}):")
+        report(f"Total dependencies: {tree['total_dependencies']}")
+        report(f"Runtime dependencies: {tree['runtime_dependencies']}")
+        report(f"Development dependencies: {tree['development_dependencies']}")
+
+        report("\nTop dependencies:")
+        for dep in tree['top_dependencies'][:5]:
+            report(f"  - {dep['name']} ({dep['platform']}) - {dep['kind']}")
+    else:
+        report(f"Dependency tree analysis failed: {tree_result.error}")
+
+    report(_SEPARATOR)
+
     # Example 3: Check package security
-    print("3. Checking package security...")
-    try:
-        security_result = await check_package_security(
-            platform="npm",
-            name="react"
-        )
-        
-        if security_result.success:
-            security = security_result.data
-            print(f"Security analysis for react:")
-            print(f"Security issues: {len(security.get('security_issues', []))}")
-            
-            if security.get('security_issues'):
-                print("Security issues found:")
-                for issue in security['security_issues']:
-                    print(f"  - {issue.get('type', 'Unknown')}: {issue.get('description', 'No description')}")
-            else:
-                print("No security issues found")
+    report("3. Checking package security...")
+    if isinstance(security_result, Exception):
+        report(f"Error: {security_result}")
+    elif security_result.success:
+        security = security_result.data
+        report(f"Security analysis for react:")
+        report(f"Security issues: {len(security.get('security_issues', []))}")
+
+        if security.get('security_issues'):
+            report("Security issues found:")
+            for issue in security['security_issues']:
+                report(f"  - {issue.get('type', 'Unknown')}: {issue.get('description', 'No description')}")
         else:
-            print(f"Security check failed: {security_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("\n" + "="*50 + "\n")
-    
+            report("No security issues found")
+    else:
+        report(f"Security check failed: {security_result.error}")
+
+    report(_SEPARATOR)
+
     # Example 4: Check license compatibility
-    print("4. Checking license compatibility...")
-    try:
-        license_result = await check_license_compatibility(
-            licenses=["MIT", "Apache-2.0"],
-            use_case="commercial"
-        )
-        
-        if license_result.success:
-            license_check = license_result.data
-            print(f"License compatibility check for commercial use:")
-            print(f"Overall compatible: {license_check['overall_compatible']}")
-            
-            print("\nLicense analysis:")
-            for license_info in license_check['licenses']:
-                print(f"  - {license_info['license']}: {license_info['compatible']} ({license_info['use_case']})")
-            
-            if license_check.get('recommendations'):
-                print("\nRecommendations:")
-                for rec in license_check['recommendations']:
-                    print(f"  - {rec}")
-        else:
-            print(f"License compatibility check failed: {license_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("\n" + "="*50 + "\n")
-    
+    report("4. Checking license compatibility...")
+    if isinstance(license_result, Exception):
+        report(f"Error: {license_result}")
+    elif license_result.success:
+        license_check = license_result.data
+        report(f"License compatibility check for commercial use:")
+        report(f"Overall compatible: {license_check['overall_compatible']}")
+
+        report("\nLicense analysis:")
+        for license_info in license_check['licenses']:
+            report(f"  - {license_info['license']}: {license_info['compatible']} ({license_info['use_case']})")
+
+        if license_check.get('recommendations'):
+            report("\nRecommendations:")
+            for rec in license_check['recommendations']:
+                report(f"  - {rec}")
+    else:
+        report(f"License compatibility check failed: {license_result.error}")
+
+    report(_SEPARATOR)
+
     # Example 5: Find alternatives
-    print("5. Finding package alternatives...")
-    try:
-        alternatives_result = await find_alternatives(
-            platform="npm",
-            name="jquery",
-            criteria=["stars", "downloads", "recent_updates"]
-        )
-        
-        if alternatives_result.success:
-            alternatives = alternatives_result.data
-            print(f"Alternatives to jquery:")
-            print(f"Found {len(alternatives['alternatives'])} alternatives")
-            
-            print("\nTop alternatives:")
-            for alt in alternatives['alternatives'][:5]:
-                print(f"  - {alt['name']} ({alt['platform']}): {alt.get('score', 'N/A')}/10")
-                print(f"    Stars: {alt.get('stars', 'N/A')}, Language: {alt.get('language', 'N/A')}")
-        else:
-            print(f"Finding alternatives failed: {alternatives_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("\n" + "="*50 + "\n")
-    
+    report("5. Finding package alternatives...")
+    if isinstance(alternatives_result, Exception):
+        report(f"Error: {alternatives_result}")
+    elif alternatives_result.success:
+        alternatives = alternatives_result.data
+        report(f"Alternatives to jquery:")
+        report(f"Found {len(alternatives['alternatives'])} alternatives")
+
+        report("\nTop alternatives:")
+        for alt in alternatives['alternatives'][:5]:
+            report(f"  - {alt['name']} ({alt['platform']}): {alt.get('score', 'N/A')}/10")
+            report(f"    Stars: {alt.get('stars', 'N/A')}, Language: {alt.get('language', 'N/A')}")
+    else:
+        report(f"Finding alternatives failed: {alternatives_result.error}")
+
+    report(_SEPARATOR)
+
     # Example 6: Get platform statistics
-    print("6. Getting platform statistics...")
-    try:
-        stats_result = await get_platform_stats(
-            platform="npm",
-            include_trending=True
-        )
-        
-        if stats_result.success:
-            stats = stats_result.data
-            print(f"npm platform statistics:")
-            print(f"Project count: {stats.get('project_count', 'N/A')}")
-            print(f"Homepage: {stats.get('homepage', 'N/A')}")
-            
-            if stats.get('sample_statistics'):
-                sample_stats = stats['sample_statistics']
-                print(f"\nSample statistics (from {sample_stats['sample_size']} packages):")
-                print(f"Total stars: {sample_stats['total_stars']}")
-                print(f"Average stars: {sample_stats['average_stars']}")
-                print(f"Most common language: {sample_stats['most_common_language']}")
-            
-            if stats.get('trending_packages'):
-                print(f"\nTrending packages:")
-                for pkg in stats['trending_packages'][:3]:
-                    print(f"  - {pkg.get('name', 'N/A')} ({pkg.get('stars', 'N/A')} stars)")
-        else:
-            print(f"Platform stats failed: {stats_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("\n" + "="*50 + "\n")
-    
+    report("6. Getting platform statistics...")
+    if isinstance(stats_result, Exception):
+        report(f"Error: {stats_result}")
+    elif stats_result.success:
+        stats = stats_result.data
+        report(f"npm platform statistics:")
+        report(f"Project count: {stats.get('project_count', 'N/A')}")
+        report(f"Homepage: {stats.get('homepage', 'N/A')}")
+
+        if stats.get('sample_statistics'):
+            sample_stats = stats['sample_statistics']
+            report(f"\nSample statistics (from {sample_stats['sample_size']} packages):")
+            report(f"Total stars: {sample_stats['total_stars']}")
+            report(f"Average stars: {sample_stats['average_stars']}")
+            report(f"Most common language: {sample_stats['most_common_language']}")
+
+        if stats.get('trending_packages'):
+            report(f"\nTrending packages:")
+            for pkg in stats['trending_packages'][:3]:
+                report(f"  - {pkg.get('name', 'N/A')} ({pkg.get('stars', 'N/A')} stars)")
+    else:
+        report(f"Platform stats failed: {stats_result.error}")
+
+    report(_SEPARATOR)
+
     # Example 7: Audit project dependencies
-    print("7. Auditing project dependencies...")
-    try:
-        audit_result = await audit_project_dependencies(
-            platform="npm",
-            packages=[
-                {"name": "react", "version": "^18.0.0"},
-                {"name": "vue", "version": "^3.0.0"},
-                {"name": "angular", "version": "^15.0.0"}
-            ],
-            check_duplicates=True,
-            check_outdated=True,
-            check_unused=False
-        )
-        
-        if audit_result.success:
-            audit = audit_result.data
-            print(f"Project audit results:")
-            print(f"Total packages: {audit['total_packages']}")
-            print(f"Project health score: {audit['project_health_score']}/100 ({audit['health_status']})")
-            
-            print("\nAudit summary:")
-            summary = audit['summary']
-            print(f"  - Duplicates: {summary['duplicates_count']}")
-            print(f"  - Outdated: {summary['outdated_count']}")
-            print(f"  - Security issues: {summary['security_issues_count']}")
-            print(f"  - Recommendations: {summary['recommendations_count']}")
-            
-            if audit.get('audits', {}).get('duplicates'):
-                print("\nDuplicate packages found:")
-                for dup in audit['audits']['duplicates']:
-                    print(f"  - {dup['package']}: {dup['recommendation']}")
-            
-            if audit.get('audits', {}).get('outdated'):
-                print("\nOutdated packages:")
-                for outdated in audit['audits']['outdated']:
-                    print(f"  - {outdated['package']}: {outdated['current_version']} -> {outdated['latest_version']}")
-        else:
-            print(f"Project audit failed: {audit_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
+    report("7. Auditing project dependencies...")
+    if isinstance(audit_result, Exception):
+        report(f"Error: {audit_result}")
+    elif audit_result.success:
+        audit = audit_result.data
+        report(f"Project audit results:")
+        report(f"Total packages: {audit['total_packages']}")
+        report(f"Project health score: {audit['project_health_score']}/100 ({audit['health_status']})")
+
+        report("\nAudit summary:")
+        summary = audit['summary']
+        report(f"  - Duplicates: {summary['duplicates_count']}")
+        report(f"  - Outdated: {summary['outdated_count']}")
+        report(f"  - Security issues: {summary['security_issues_count']}")
+        report(f"  - Recommendations: {summary['recommendations_count']}")
+
+        if audit.get('audits', {}).get('duplicates'):
+            report("\nDuplicate packages found:")
+            for dup in audit['audits']['duplicates']:
+                report(f"  - {dup['package']}: {dup['recommendation']}")
+
+        if audit.get('audits', {}).get('outdated'):
+            report("\nOutdated packages:")
+            for outdated in audit['audits']['outdated']:
+                report(f"  - {outdated['package']}: {outdated['current_version']} -> {outdated['latest_version']}")
+    else:
+        report(f"Project audit failed: {audit_result.error}")
+
+    sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -5,7 +5,11 @@ This file demonstrates basic usage patterns for the Libraries.io MCP Server.
 """
 
 import asyncio
+import io
 import os
+import sys
+from functools import partial
+from itertools import islice
 from libraries_io_mcp.client import LibrariesIOClient
 from libraries_io_mcp.tools import (
     search_packages,
@@ -16,158 +20,152 @@ from libraries_io_mcp.tools import (
     get_popular_packages
 )
 
+# Section separator, hoisted so the string is built once per process
+_SEPARATOR = "\n" + "=" * 50 + "\n"
+
+# Read once at import; os.getenv does a dict lookup plus a string copy on
+# every call, and the key cannot change mid-run anyway
+_API_KEY = os.getenv("LIBRARIES_IO_API_KEY")
+
 async def main():
     """Basic usage examples."""
-    
-    # Initialize client
-    api_key = os.getenv("LIBRARIES_IO_API_KEY")
-    if not api_key:
+
+    if not _API_KEY:
         print("Please set LIBRARIES_IO_API_KEY environment variable")
         return
-    
-    client = LibrariesIOClient(api_key=api_key)
-    
+
     print("=== Basic Usage Examples ===\n")
-    
-    # Example 1: Search for packages
-    print("1. Searching for packages...")
-    try:
-        search_result = await search_packages(
-            query="react",
-            platforms=["npm"],
-            per_page=5
+
+    # Share one client (and its keep-alive connection pool) across all
+    # example calls, and close it when done. The calls are independent and
+    # I/O-bound, so run them concurrently and print the results afterwards;
+    # total wall-clock time is bounded by the slowest call instead of the
+    # sum of all of them.
+    async with LibrariesIOClient(api_key=_API_KEY) as client:
+        results = await asyncio.gather(
+            search_packages(query="react", platforms=["npm"], per_page=5),
+            get_package_info(platform="npm", name="react", include_versions=True),
+            get_package_versions(platform="npm", name="react"),
+            get_package_dependencies(platform="npm", name="react"),
+            get_trending_packages(platform="npm"),
+            get_popular_packages(platform="npm"),
+            return_exceptions=True
         )
-        
-        if search_result.success:
-            if search_result.data:
-                packages = search_result.data.get('packages', [])
-                print(f"Found {len(packages)} packages:")
-                for pkg in packages:
-                    print(f"  - {pkg.get('name', 'N/A')} ({pkg.get('platform', 'N/A')}) - {pkg.get('description', 'N/A')}")
-            else:
-                print("No search data returned")
+    (
+        search_result, package_result, versions_result,
+        deps_result, trending_result, popular_result
+    ) = results
+
+    # Buffer the report and emit it with a single write instead of
+    # dozens of line-buffered print calls.
+    buf = io.StringIO()
+    report = partial(print, file=buf)
+
+    # Example 1: Search for packages
+    report("1. Searching for packages...")
+    if isinstance(search_result, Exception):
+        report(f"Error: {search_result}")
+    elif search_result.success:
+        if search_result.data:
+            packages = search_result.data.get('packages', [])
+            report(f"Found {len(packages)} packages:")
+            for pkg in packages:
+                report(f"  - {pkg.get('name', 'N/A')} ({pkg.get('platform', 'N/A')}) - {pkg.get('description', 'N/A')}")
         else:
-            print(f"Search failed: {search_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("\n" + "="*50 + "\n")
-    
+            report("No search data returned")
+    else:
+        report(f"Search failed: {search_result.error}")
+
+    report(_SEPARATOR)
+
     # Example 2: Get package information
-    print("2. Getting package information...")
-    try:
-        package_result = await get_package_info(
-            platform="npm",
-            name="react",
-            include_versions=True
-        )
-        
-        if package_result.success:
-            package = package_result.data
-            if package:
-                print(f"Package: {package.get('name', 'N/A')}")
-                print(f"Platform: {package.get('platform', 'N/A')}")
-                print(f"Description: {package.get('description', 'N/A')}")
-                print(f"Stars: {package.get('stars', 'N/A')}")
-                print(f"Latest Version: {package.get('latest_version', 'N/A')}")
-                print(f"Language: {package.get('language', 'N/A')}")
-                print(f"Homepage: {package.get('homepage', 'N/A')}")
-            else:
-                print("No package data returned")
+    report("2. Getting package information...")
+    if isinstance(package_result, Exception):
+        report(f"Error: {package_result}")
+    elif package_result.success:
+        package = package_result.data
+        if package:
+            report(f"Package: {package.get('name', 'N/A')}")
+            report(f"Platform: {package.get('platform', 'N/A')}")
+            report(f"Description: {package.get('description', 'N/A')}")
+            report(f"Stars: {package.get('stars', 'N/A')}")
+            report(f"Latest Version: {package.get('latest_version', 'N/A')}")
+            report(f"Language: {package.get('language', 'N/A')}")
+            report(f"Homepage: {package.get('homepage', 'N/A')}")
         else:
-            print(f"Package info failed: {package_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("\n" + "="*50 + "\n")
-    
+            report("No package data returned")
+    else:
+        report(f"Package info failed: {package_result.error}")
+
+    report(_SEPARATOR)
+
     # Example 3: Get package versions
-    print("3. Getting package versions...")
-    try:
-        versions_result = await get_package_versions(
-            platform="npm",
-            name="react"
-        )
-        
-        if versions_result.success:
-            versions = versions_result.data
-            if versions:
-                print(f"Found {len(versions)} versions:")
-                for version in list(versions)[:5]:  # Show first 5 versions
-                    print(f"  - {version.get('number', 'N/A')} (published: {version.get('published_at', 'N/A')})" if isinstance(version, dict) else f"  - {version}")
-            else:
-                print("No versions data returned")
+    report("3. Getting package versions...")
+    if isinstance(versions_result, Exception):
+        report(f"Error: {versions_result}")
+    elif versions_result.success:
+        versions = versions_result.data
+        if versions:
+            report(f"Found {len(versions)} versions:")
+            for version in islice(versions, 5):  # Show first 5 versions
+                report(f"  - {version.get('number', 'N/A')} (published: {version.get('published_at', 'N/A')})" if isinstance(version, dict) else f"  - {version}")
         else:
-            print(f"Versions failed: {versions_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("\n" + "="*50 + "\n")
-    
+            report("No versions data returned")
+    else:
+        report(f"Versions failed: {versions_result.error}")
+
+    report(_SEPARATOR)
+
     # Example 4: Get package dependencies
-    print("4. Getting package dependencies...")
-    try:
-        deps_result = await get_package_dependencies(
-            platform="npm",
-            name="react"
-        )
-        
-        if deps_result.success:
-            dependencies = deps_result.data
-            if dependencies:
-                print(f"Found {len(dependencies)} dependencies:")
-                for dep in list(dependencies)[:5]:  # Show first 5 dependencies
-                    print(f"  - {dep.get('name', 'N/A')} ({dep.get('platform', 'N/A')}) - {dep.get('kind', 'N/A')}" if isinstance(dep, dict) else f"  - {dep}")
-            else:
-                print("No dependencies data returned")
+    report("4. Getting package dependencies...")
+    if isinstance(deps_result, Exception):
+        report(f"Error: {deps_result}")
+    elif deps_result.success:
+        dependencies = deps_result.data
+        if dependencies:
+            report(f"Found {len(dependencies)} dependencies:")
+            for dep in islice(dependencies, 5):  # Show first 5 dependencies
+                report(f"  - {dep.get('name', 'N/A')} ({dep.get('platform', 'N/A')}) - {dep.get('kind', 'N/A')}" if isinstance(dep, dict) else f"  - {dep}")
         else:
-            print(f"Dependencies failed: {deps_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("\n" + "="*50 + "\n")
-    
+            report("No dependencies data returned")
+    else:
+        report(f"Dependencies failed: {deps_result.error}")
+
+    report(_SEPARATOR)
+
     # Example 5: Get trending packages
-    print("5. Getting trending packages...")
-    try:
-        trending_result = await get_trending_packages(
-            platform="npm"
-        )
-        
-        if trending_result.success:
-            trending = trending_result.data
-            if trending and trending.get('packages'):
-                print(f"Top {len(trending['packages'])} trending packages:")
-                for pkg in trending['packages']:
-                    print(f"  - {pkg.get('name', 'N/A')} ({pkg.get('platform', 'N/A')}) - {pkg.get('stars', 'N/A')} stars")
-            else:
-                print("No trending packages data returned")
+    report("5. Getting trending packages...")
+    if isinstance(trending_result, Exception):
+        report(f"Error: {trending_result}")
+    elif trending_result.success:
+        trending = trending_result.data
+        if trending and trending.get('packages'):
+            report(f"Top {len(trending['packages'])} trending packages:")
+            for pkg in trending['packages']:
+                report(f"  - {pkg.get('name', 'N/A')} ({pkg.get('platform', 'N/A')}) - {pkg.get('stars', 'N/A')} stars")
         else:
-            print(f"Trending packages failed: {trending_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("\n" + "="*50 + "\n")
-    
+            report("No trending packages data returned")
+    else:
+        report(f"Trending packages failed: {trending_result.error}")
+
+    report(_SEPARATOR)
+
     # Example 6: Get popular packages
-    print("6. Getting popular packages...")
-    try:
-        popular_result = await get_popular_packages(
-            platform="npm"
-        )
-        
-        if popular_result.success:
-            popular = popular_result.data
-            if popular and popular.get('packages'):
-                print(f"Top {len(popular['packages'])} popular packages:")
-                for pkg in popular['packages']:
-                    print(f"  - {pkg.get('name', 'N/A')} ({pkg.get('platform', 'N/A')}) - {pkg.get('stars', 'N/A')} stars")
-            else:
-                print("No popular packages data returned")
+    report("6. Getting popular packages...")
+    if isinstance(popular_result, Exception):
+        report(f"Error: {popular_result}")
+    elif popular_result.success:
+        popular = popular_result.data
+        if popular and popular.get('packages'):
+            report(f"Top {len(popular['packages'])} popular packages:")
+            for pkg in popular['packages']:
+                report(f"  - {pkg.get('name', 'N/A')} ({pkg.get('platform', 'N/A')}) - {pkg.get('stars', 'N/A')} stars")
         else:
-            print(f"Popular packages failed: {popular_result.error}")
-    except Exception as e:
-        print(f"Error: {e}")
+            report("No popular packages data returned")
+    else:
+        report(f"Popular packages failed: {popular_result.error}")
+
+    sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -6,7 +6,10 @@ as an MCP client with various MCP tools and resources.
 """
 
 import asyncio
-import json
+import getpass
+import os
+import sys
+from operator import itemgetter
 from typing import Dict, Any, List
 from libraries_io_mcp.client import LibrariesIOClient
 from libraries_io_mcp.server import create_server
@@ -17,18 +20,41 @@ class MCPClientExample:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.client = LibrariesIOClient(api_key=api_key)
-        self.server = create_server()
-    
+        self._server = None
+
+    @property
+    def server(self):
+        """MCP server, created on first access.
+
+        The examples only exercise the client directly, so pay the server
+        registration cost (tools, resources, prompts) only when the server
+        is actually used. It shares the client so both use one connection
+        pool, cache, and rate limit bucket.
+        """
+        if self._server is None:
+            self._server = create_server(client=self.client)
+        return self._server
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
     async def search_packages_example(self) -> Dict[str, Any]:
         """Example of searching for packages."""
         print("=== Searching for packages ===")
         
-        # Search for React packages
+        # Search for React packages; only request the fields the example
+        # prints so the API returns smaller payloads
         result = await self.client.search_packages(
             query="react",
             platforms=["npm"],
             page=1,
-            per_page=5
+            per_page=5,
+            fields=["name", "platform", "stars", "description"]
         )
         
         if result.success:
@@ -84,9 +110,10 @@ class MCPClientExample:
             dependencies = result.data
             print(f"Found {len(dependencies)} dependencies:")
             
-            # Group by dependency type
-            runtime_deps = [d for d in dependencies if d.get('kind') != 'development']
-            dev_deps = [d for d in dependencies if d.get('kind') == 'development']
+            # Group by dependency type in a single pass
+            runtime_deps, dev_deps = [], []
+            for d in dependencies:
+                (dev_deps if d.get('kind') == 'development' else runtime_deps).append(d)
             
             print(f"Runtime dependencies: {len(runtime_deps)}")
             print(f"Development dependencies: {len(dev_deps)}")
@@ -145,12 +172,11 @@ class MCPClientExample:
             comparison = result.data
             print(f"Comparison of {len(comparison.get('packages', []))} packages:")
             
-            # Sort by stars
-            sorted_packages = sorted(
-                comparison.get('packages', []),
-                key=lambda x: x.get('stars', 0),
-                reverse=True
-            )
+            # Sort by stars; pre-normalizing into tuples lets sort use the
+            # C-level itemgetter key instead of a Python lambda per element
+            keyed = [(p.get('stars') or 0, p) for p in comparison.get('packages', [])]
+            keyed.sort(key=itemgetter(0), reverse=True)
+            sorted_packages = [p for _, p in keyed]
             
             for pkg in sorted_packages:
                 print(f"\n{pkg.get('name', 'N/A')} ({pkg.get('platform', 'N/A')}):")
@@ -240,48 +266,51 @@ class MCPClientExample:
         print("Libraries.io MCP Server - Client Examples")
         print("=" * 50)
         
-        try:
-            # Run all examples
-            await self.search_packages_example()
-            await self.get_package_info_example()
-            await self.get_package_dependencies_example()
-            await self.get_trending_packages_example()
-            await self.compare_packages_example()
-            await self.analyze_project_health_example()
-            await self.get_platform_statistics_example()
-            
-            print("\n" + "=" * 50)
-            print("All examples completed successfully!")
-            
-        except Exception as e:
-            print(f"Error running examples: {e}")
-            raise
+        # The examples are independent, so run them concurrently; the
+        # wall-clock time is bounded by the slowest example instead of the
+        # sum of all of them.
+        results = await asyncio.gather(
+            self.search_packages_example(),
+            self.get_package_info_example(),
+            self.get_package_dependencies_example(),
+            self.get_trending_packages_example(),
+            self.compare_packages_example(),
+            self.analyze_project_health_example(),
+            self.get_platform_statistics_example(),
+            return_exceptions=True
+        )
+
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            print(f"Error running examples: {errors[0]}")
+            raise errors[0]
+
+        print("\n" + "=" * 50)
+        print("All examples completed successfully!")
     
     async def close(self):
         """Close the client and server."""
         await self.client.close()
-        if hasattr(self.server, 'close'):
-            await self.server.close()
+        if self._server is not None and hasattr(self._server, 'close'):
+            await self._server.close()
 
 async def main():
     """Main function to run the MCP client examples."""
-    # Get API key from environment
-    api_key = input("Enter your Libraries.io API key (or press Enter to use environment variable): ").strip()
-    
-    if not api_key:
-        api_key = input("Please enter your Libraries.io API key: ").strip()
-    
+    # Get API key from the environment so the example can run unattended;
+    # only fall back to prompting when attached to a real terminal.
+    api_key = os.environ.get("LIBRARIES_IO_API_KEY", "").strip()
+
+    if not api_key and sys.stdin.isatty():
+        api_key = getpass.getpass("Enter your Libraries.io API key: ").strip()
+
     if not api_key:
         print("No API key provided. Please set LIBRARIES_IO_API_KEY environment variable.")
         return
     
-    # Create and run client example
-    client_example = MCPClientExample(api_key)
-    
-    try:
+    # Create and run client example; the context manager guarantees the
+    # shared HTTP connection pool is closed when the examples finish.
+    async with MCPClientExample(api_key) as client_example:
         await client_example.run_all_examples()
-    finally:
-        await client_example.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -27,8 +27,11 @@ async def main():
     # Create server
     server = create_server()
     
-    print(f"Starting Libraries.io MCP Server...")
-    print(f"API Key: {'*' * (len(api_key) - 4) + api_key[-4:] if len(api_key) > 4 else '*' * len(api_key)}")
+    # Mask the key once and reuse; only the last four characters show
+    masked_key = '*' * max(0, len(api_key) - 4) + api_key[-4:] if len(api_key) > 4 else '*' * len(api_key)
+
+    print("Starting Libraries.io MCP Server...")
+    print(f"API Key: {masked_key}")
     print(f"Base URL: {os.getenv('LIBRARIES_IO_BASE_URL', 'https://libraries.io/api/v1')}")
     print(f"Rate Limit: {os.getenv('RATE_LIMIT_REQUESTS', '100')} requests per {os.getenv('RATE_LIMIT_WINDOW', '3600')} seconds")
     print()
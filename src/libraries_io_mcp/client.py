@@ -5,28 +5,48 @@ This module contains the client for interacting with the Libraries.io API.
 """
 
 import asyncio
+import hashlib
 import os
 import logging
-from typing import Optional, Dict, Any, List, Union
+from typing import AsyncIterator, Optional, Dict, Any, List, Union
 from datetime import datetime
 
 import httpx
 from pydantic import ValidationError
 
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .models import (
     Platform, Package, PackageVersion, Dependency, Repository,
     User, Organization, SearchResult, APIError, RateLimitInfo,
     PlatformsResponse, PackageResponse, DependenciesResponse,
     DependentsResponse, SearchResponse, UserResponse, OrganizationResponse,
-    RepositoryResponse
+    RepositoryResponse, validate_platform_list, validate_version_list
 )
 from .utils import (
-    RateLimiter, MemoryCache, RetryHandler, HTTPClientHelper,
-    validate_platform, sanitize_package_name,
-    default_rate_limiter, default_cache, default_retry_handler
+    TokenBucketRateLimiter, MemoryCache, RetryHandler, HTTPClientHelper,
+    validate_platform, sanitize_package_name
 )
 
 
+# Repository hosts supported by get_repository: platform -> (display name,
+# canonical URL prefix). Module-level so no list/dict is rebuilt per call.
+_REPO_PREFIXES = {
+    'github': ('GitHub', 'https://github.com/'),
+    'gitlab': ('GitLab', 'https://gitlab.com/'),
+    'bitbucket': ('Bitbucket', 'https://bitbucket.org/'),
+}
+
+
 class LibrariesIOClientError(Exception):
     """Base exception for Libraries.io client errors."""
     pass
@@ -70,6 +90,8 @@ class LibrariesIOClient:
         cache_max_size: int = 1000,
         max_retries: int = 3,
         timeout: float = 30.0,
+        max_concurrency: int = 10,
+        max_connections: int = 100,
         logger: Optional[logging.Logger] = None
     ):
         """
@@ -84,6 +106,8 @@ class LibrariesIOClient:
             cache_max_size: Maximum number of cache entries
             max_retries: Maximum number of retry attempts for failed requests
             timeout: Request timeout in seconds
+            max_concurrency: Maximum number of concurrent in-flight requests
+            max_connections: Maximum size of the HTTP connection pool
             logger: Optional logger instance
         """
         self.api_key = api_key or os.getenv("LIBRARIES_IO_API_KEY")
@@ -91,20 +115,46 @@ class LibrariesIOClient:
             raise ValueError("API key is required. Set LIBRARIES_IO_API_KEY environment variable or pass api_key parameter.")
         
         self.base_url = base_url.rstrip("/")
+        # Precomputed with trailing slash so request URLs are built by plain
+        # concatenation instead of f-string plus lstrip per call
+        self._base = self.base_url + "/"
         self.timeout = timeout
+
+        # Short stable digest of the API key, computed once so cache keys
+        # don't embed the raw key and don't re-hash it per request
+        self._api_key_tag = hashlib.blake2b(
+            self.api_key.encode(), digest_size=8
+        ).digest()
+        
+        # Initialize rate limiter; the token bucket allows short bursts of
+        # concurrent requests while keeping the sustained rate within limits
+        self.rate_limiter = TokenBucketRateLimiter(
+            rate_limit, rate_limit_window, max_concurrency=max_concurrency
+        )
         
-        # Initialize rate limiter
-        self.rate_limiter = RateLimiter(rate_limit, rate_limit_window)
-        
+        # Bound in-flight parallelism: the token bucket enforces the rate,
+        # the semaphore keeps concurrent requests within the pool size
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+
         # Initialize cache
         self.cache = MemoryCache(cache_ttl, cache_max_size)
         
         # Initialize retry handler
         self.retry_handler = RetryHandler(max_retries)
         
-        # Initialize HTTP client
+        # Initialize HTTP client with an explicit connection pool so large
+        # fan-outs (dependency trees, comparisons) reuse keep-alive
+        # connections instead of paying TCP+TLS setup per request. HTTP/2
+        # multiplexes them over one connection when the optional h2 package
+        # is installed.
         self.session = httpx.AsyncClient(
-            timeout=timeout,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=min(50, max_connections),
+                keepalive_expiry=30.0
+            ),
+            timeout=httpx.Timeout(timeout, connect=5.0),
             headers={
                 "User-Agent": "LibrariesIO-MCP-Client/1.0.0",
                 "Accept": "application/json"
@@ -114,8 +164,21 @@ class LibrariesIOClient:
         # Logger
         self.logger = logger or logging.getLogger(__name__)
         
-        # Rate limit info tracking
+        # Rate limit info tracking; the dict form is maintained alongside
+        # so response tails can attach it without re-serializing per call
         self._rate_limit_info: Optional[RateLimitInfo] = None
+        self._rate_limit_dump: Optional[Dict[str, Any]] = None
+
+        # In-flight de-duplication for hot package lookups: concurrent
+        # callers asking for the same package share one fetch (and one
+        # model-parsing pass). Entries are dropped once settled — result
+        # caching stays with the TTL-bounded MemoryCache so package data
+        # can't go permanently stale in a long-running server.
+        self._package_futures: Dict[tuple, "asyncio.Future"] = {}
+
+        # Single-flight map for _make_request: concurrent identical requests
+        # share one HTTP round-trip instead of racing past the cache miss
+        self._inflight: Dict[tuple, "asyncio.Future"] = {}
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -129,21 +192,60 @@ class LibrariesIOClient:
         """Close the HTTP client session."""
         await self.session.aclose()
     
-    def _get_cache_key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
-        """Generate cache key for endpoint and parameters."""
-        # Add API key to params for cache key generation
-        cache_params = params.copy() if params else {}
-        cache_params['api_key'] = self.api_key
-        
-        import json
-        key_data = {
-            'endpoint': endpoint,
-            'params': cache_params
-        }
-        key_string = json.dumps(key_data, sort_keys=True)
-        import hashlib
-        return hashlib.md5(key_string.encode()).hexdigest()
+    def _get_cache_key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> tuple:
+        """Generate cache key for endpoint and parameters.
+
+        The key is a plain tuple used directly as a dict key: no copy, no
+        serialization, no hashing per request. The API key appears only as
+        its precomputed digest tag.
+        """
+        if not params:
+            return (endpoint, self._api_key_tag)
+        return (endpoint, self._api_key_tag, tuple(sorted(params.items())))
     
+    async def _single_flight_call(self, key: tuple, fetch) -> Any:
+        """
+        De-duplicate concurrent API calls for the same key.
+
+        The Future is stored before the fetch starts, so concurrent callers
+        asking for the same key share a single request instead of each
+        issuing their own. The entry is removed as soon as the fetch
+        settles, so the map only ever holds in-flight work — repeated
+        lookups are served by the TTL cache in ``_make_request``, keeping
+        results fresh and the map bounded.
+
+        Args:
+            key: Hashable de-duplication key
+            fetch: Zero-argument coroutine function performing the call
+
+        Returns:
+            Result of the call (shared across callers)
+        """
+        future = self._package_futures.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_event_loop().create_future()
+        self._package_futures[key] = future
+
+        try:
+            result = await fetch()
+            if not future.done():
+                future.set_result(result)
+            return result
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # mark retrieved for the initiating caller
+            raise
+        finally:
+            # A cancelled initiator bypasses the except clause; cancel the
+            # future so shielded waiters aren't stranded on a pending future
+            # that just left the map.
+            if not future.done():
+                future.cancel()
+            self._package_futures.pop(key, None)
+
     def _add_api_key(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Add API key to parameters."""
         if params is None:
@@ -153,7 +255,13 @@ class LibrariesIOClient:
     
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Handle HTTP response and parse JSON."""
+        # orjson decodes large pages (100-item dependents/version lists)
+        # several times faster than stdlib json; fall back when the optional
+        # dependency is not installed. Its decode error is a ValueError, so
+        # one except covers both paths.
         try:
+            if orjson is not None:
+                return orjson.loads(response.content)
             return response.json()
         except ValueError as e:
             raise LibrariesIOClientError(f"Invalid JSON response: {e}")
@@ -163,12 +271,23 @@ class LibrariesIOClient:
         rate_limit_info = HTTPClientHelper.parse_rate_limit(response.headers)
         if rate_limit_info:
             self._rate_limit_info = rate_limit_info
-            
-            # Log rate limit usage
-            self.logger.debug(
-                f"Rate limit: {rate_limit_info.used}/{rate_limit_info.limit} "
-                f"({rate_limit_info.remaining} remaining, resets at {datetime.fromtimestamp(rate_limit_info.reset)})"
-            )
+            self._rate_limit_dump = {
+                "limit": rate_limit_info.limit,
+                "remaining": rate_limit_info.remaining,
+                "reset": rate_limit_info.reset,
+                "used": rate_limit_info.used
+            }
+
+            # Log rate limit usage; %-style args defer all formatting (and
+            # the datetime construction) until DEBUG is actually enabled
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Rate limit: %d/%d (%d remaining, resets at %s)",
+                    rate_limit_info.used,
+                    rate_limit_info.limit,
+                    rate_limit_info.remaining,
+                    datetime.fromtimestamp(rate_limit_info.reset)
+                )
             
             # Raise rate limit error if we're about to exceed
             if rate_limit_info.remaining <= 0:
@@ -176,8 +295,6 @@ class LibrariesIOClient:
     
     def _handle_error(self, response: httpx.Response) -> LibrariesIOClientError:
         """Handle HTTP error responses."""
-        self._check_rate_limit(response)
-        
         error_message = HTTPClientHelper.get_error_message(response.text)
         
         if response.status_code == 401:
@@ -216,40 +333,67 @@ class LibrariesIOClient:
         # Add API key to parameters
         params = self._add_api_key(params)
         
-        # Generate cache key
+        # Generate the cache key once; both the lookup and the later store
+        # reuse it instead of hashing the parameters twice
         cache_key = self._get_cache_key(endpoint, params)
-        
+
         # Check cache first
-        cached_data = await self.cache.get(endpoint, params)
+        cached_data = await self.cache.get_by_key(cache_key)
         if cached_data is not None:
             self.logger.debug(f"Cache hit for {endpoint}")
             return cached_data
         
-        # Rate limiting
-        await self.rate_limiter.acquire()
-        
+        # Single-flight: if an identical request is already in flight, await
+        # its result instead of issuing a duplicate HTTP round-trip
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_event_loop().create_future()
+        self._inflight[cache_key] = future
+
         # Make request with retry logic
         try:
-            response = await self.retry_handler.retry(
-                self._execute_request,
-                method,
-                endpoint,
-                params,
-                data
-            )
-            
+            # Rate limiting
+            await self.rate_limiter.acquire()
+
+            async with self._concurrency:
+                response = await self.retry_handler.retry(
+                    self._execute_request,
+                    method,
+                    endpoint,
+                    params,
+                    data
+                )
+
             # Parse response
             data = self._handle_response(response)
-            
+
             # Cache response
-            await self.cache.set(endpoint, params, data)
-            
+            await self.cache.set_by_key(cache_key, data)
+
+            if not future.done():
+                future.set_result(data)
             return data
-            
-        except LibrariesIOClientError:
+
+        except LibrariesIOClientError as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # mark retrieved for the initiating caller
             raise
         except Exception as e:
-            raise LibrariesIOClientError(f"Request failed: {e}")
+            error = LibrariesIOClientError(f"Request failed: {e}")
+            if not future.done():
+                future.set_exception(error)
+                future.exception()  # mark retrieved for the initiating caller
+            raise error
+        finally:
+            # A cancelled initiator bypasses the except clauses above; cancel
+            # the future so shielded waiters get CancelledError instead of
+            # hanging on an entry that was just dropped from the map.
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(cache_key, None)
     
     async def _execute_request(
         self,
@@ -259,9 +403,9 @@ class LibrariesIOClient:
         data: Optional[Dict[str, Any]] = None
     ) -> httpx.Response:
         """Execute single HTTP request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        
-        self.logger.debug(f"Making {method} request to {url}")
+        url = self._base + (endpoint[1:] if endpoint.startswith('/') else endpoint)
+
+        self.logger.debug("Making %s request to %s", method, url)
         
         response = await self.session.request(
             method=method,
@@ -270,22 +414,28 @@ class LibrariesIOClient:
             json=data
         )
         
+        # Parse rate-limit headers exactly once per response, then branch
+        # on status; _handle_error no longer re-parses them
+        self._check_rate_limit(response)
+
         # Check for errors
         if response.status_code >= 400:
             raise self._handle_error(response)
-        
-        # Check rate limit
-        self._check_rate_limit(response)
-        
+
         return response
     
     def get_rate_limit_info(self) -> Optional[RateLimitInfo]:
         """Get current rate limit information."""
         return self._rate_limit_info
+
+    def get_rate_limit_dict(self) -> Optional[Dict[str, Any]]:
+        """Get current rate limit information as an already-built dict."""
+        return self._rate_limit_dump
     
     async def clear_cache(self) -> None:
         """Clear all cached data."""
         await self.cache.clear()
+        self._package_futures.clear()
         self.logger.info("Cache cleared")
     
     # API Endpoints
@@ -300,7 +450,7 @@ class LibrariesIOClient:
         data = await self._make_request("GET", "platforms")
         
         try:
-            return [Platform(**platform_data) for platform_data in data]
+            return validate_platform_list(data)
         except ValidationError as e:
             raise LibrariesIOClientError(f"Invalid platforms data: {e}")
     
@@ -308,35 +458,46 @@ class LibrariesIOClient:
         self,
         platform: str,
         name: str,
-        include_versions: bool = False
+        include_versions: bool = False,
+        fields: Optional[List[str]] = None
     ) -> Package:
         """
         Get package information.
-        
+
         Args:
             platform: Package manager platform
             name: Package name
             include_versions: Whether to include version information
-            
+            fields: Only return these response fields (smaller payloads)
+
         Returns:
             Package information
         """
         if not validate_platform(platform):
             raise ValueError(f"Invalid platform: {platform}")
-        
+
         name = sanitize_package_name(name)
-        
+
         params = {}
         if include_versions:
             params['include_versions'] = 'true'
-        
+        if fields:
+            params['fields'] = ','.join(fields)
+
         endpoint = f"projects/{platform}/{name}"
-        data = await self._make_request("GET", endpoint, params)
-        
-        try:
-            return Package(**data)
-        except ValidationError as e:
-            raise LibrariesIOClientError(f"Invalid package data: {e}")
+
+        async def fetch() -> Package:
+            data = await self._make_request("GET", endpoint, params)
+
+            try:
+                return Package.from_api(data)
+            except (TypeError, ValueError, AttributeError) as e:
+                raise LibrariesIOClientError(f"Invalid package data: {e}")
+
+        return await self._single_flight_call(
+            ("package", platform, name, include_versions, tuple(fields) if fields else None),
+            fetch
+        )
     
     async def get_package_versions(
         self,
@@ -362,7 +523,7 @@ class LibrariesIOClient:
         data = await self._make_request("GET", endpoint)
         
         try:
-            return [PackageVersion(**version_data) for version_data in data]
+            return validate_version_list(data)
         except ValidationError as e:
             raise LibrariesIOClientError(f"Invalid versions data: {e}")
     
@@ -392,14 +553,44 @@ class LibrariesIOClient:
         params = {}
         if version:
             params['version'] = version
-        
-        data = await self._make_request("GET", endpoint, params)
-        
-        try:
-            return [Dependency(**dep_data) for dep_data in data]
-        except ValidationError as e:
-            raise LibrariesIOClientError(f"Invalid dependencies data: {e}")
+
+        async def fetch() -> List[Dependency]:
+            data = await self._make_request("GET", endpoint, params)
+
+            try:
+                return [Dependency.from_api(item) for item in data]
+            except (TypeError, ValueError, AttributeError) as e:
+                raise LibrariesIOClientError(f"Invalid dependencies data: {e}")
+
+        return await self._single_flight_call(("dependencies", platform, name, version), fetch)
     
+    async def get_many_dependencies(
+        self,
+        items: List[tuple],
+        max_concurrency: int = 10
+    ) -> List[List[Dependency]]:
+        """
+        Fetch dependencies for many packages concurrently.
+
+        Callers walking dependency graphs otherwise issue one request at a
+        time; batching them under a semaphore lets the single-flight map,
+        cache, and connection pool absorb the fan-out.
+
+        Args:
+            items: (platform, name) or (platform, name, version) tuples
+            max_concurrency: Maximum number of concurrent fetches
+
+        Returns:
+            Dependency lists in the same order as items
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_one(item: tuple) -> List[Dependency]:
+            async with semaphore:
+                return await self.get_package_dependencies(*item)
+
+        return list(await asyncio.gather(*(fetch_one(item) for item in items)))
+
     async def get_package_dependents(
         self,
         platform: str,
@@ -433,10 +624,59 @@ class LibrariesIOClient:
         data = await self._make_request("GET", endpoint, params)
         
         try:
-            return [Package(**pkg_data) for pkg_data in data]
-        except ValidationError as e:
+            return [Package.from_api(item) for item in data]
+        except (TypeError, ValueError, AttributeError) as e:
             raise LibrariesIOClientError(f"Invalid dependents data: {e}")
     
+    async def iter_dependents(
+        self,
+        platform: str,
+        name: str,
+        per_page: int = 100,
+        max_concurrency: int = 5
+    ) -> AsyncIterator[Package]:
+        """
+        Iterate over all dependent packages across pages.
+
+        Page 1 is probed alone — most packages fit in a single page, which
+        then costs exactly one request. Only when the probe comes back full
+        are the remaining pages fetched in pipelined batches of
+        ``max_concurrency``, so a full enumeration costs roughly one
+        round-trip per batch instead of one per page. Iteration stops after
+        the first short page.
+
+        Args:
+            platform: Package manager platform
+            name: Package name
+            per_page: Items per page (max 100)
+            max_concurrency: Number of pages fetched concurrently
+
+        Yields:
+            Dependent packages in page order
+        """
+        page_size = min(per_page, 100)
+
+        first = await self.get_package_dependents(platform, name, page=1, per_page=per_page)
+        for package in first:
+            yield package
+        if len(first) < page_size:
+            return
+
+        page = 2
+        while True:
+            batch = await asyncio.gather(*(
+                self.get_package_dependents(platform, name, page=p, per_page=per_page)
+                for p in range(page, page + max_concurrency)
+            ))
+
+            for packages in batch:
+                for package in packages:
+                    yield package
+                if len(packages) < page_size:
+                    return
+
+            page += max_concurrency
+
     async def search_packages(
         self,
         query: str,
@@ -444,11 +684,12 @@ class LibrariesIOClient:
         languages: Optional[List[str]] = None,
         licenses: Optional[List[str]] = None,
         page: int = 1,
-        per_page: int = 10
+        per_page: int = 10,
+        fields: Optional[List[str]] = None
     ) -> SearchResult:
         """
         Search for packages.
-        
+
         Args:
             query: Search query
             platforms: Filter by platforms
@@ -456,7 +697,8 @@ class LibrariesIOClient:
             licenses: Filter by licenses
             page: Page number
             per_page: Items per page (max 100)
-            
+            fields: Only return these response fields (smaller payloads)
+
         Returns:
             Search results
         """
@@ -465,19 +707,21 @@ class LibrariesIOClient:
             'page': page,
             'per_page': min(per_page, 100)
         }
-        
+
         if platforms:
             params['platforms'] = ','.join(platforms)
         if languages:
             params['languages'] = ','.join(languages)
         if licenses:
             params['licenses'] = ','.join(licenses)
+        if fields:
+            params['fields'] = ','.join(fields)
         
         data = await self._make_request("GET", "search", params)
         
         try:
-            return SearchResult(**data)
-        except ValidationError as e:
+            return SearchResult.from_api(data)
+        except (TypeError, ValueError, AttributeError) as e:
             raise LibrariesIOClientError(f"Invalid search data: {e}")
     
     async def get_user(self, username: str) -> User:
@@ -524,8 +768,8 @@ class LibrariesIOClient:
         data = await self._make_request("GET", endpoint, params)
         
         try:
-            return [Package(**pkg_data) for pkg_data in data]
-        except ValidationError as e:
+            return [Package.from_api(item) for item in data]
+        except (TypeError, ValueError, AttributeError) as e:
             raise LibrariesIOClientError(f"Invalid user packages data: {e}")
     
     async def get_organization(self, org_name: str) -> Organization:
@@ -572,8 +816,8 @@ class LibrariesIOClient:
         data = await self._make_request("GET", endpoint, params)
         
         try:
-            return [Package(**pkg_data) for pkg_data in data]
-        except ValidationError as e:
+            return [Package.from_api(item) for item in data]
+        except (TypeError, ValueError, AttributeError) as e:
             raise LibrariesIOClientError(f"Invalid organization packages data: {e}")
     
     async def get_repository(self, platform: str, repo_url: str) -> Repository:
@@ -587,35 +831,21 @@ class LibrariesIOClient:
         Returns:
             Repository information
         """
-        if platform not in ['github', 'gitlab', 'bitbucket']:
+        host = _REPO_PREFIXES.get(platform)
+        if host is None:
             raise ValueError(f"Invalid platform for repository: {platform}")
-        
-        # Extract owner/repo from URL
-        if platform == 'github':
-            if not repo_url.startswith('https://github.com/'):
-                raise ValueError("GitHub repository URL must start with https://github.com/")
-            parts = repo_url.replace('https://github.com/', '').split('/')
-            if len(parts) < 2:
-                raise ValueError("Invalid GitHub repository URL format")
-            owner, repo = parts[0], parts[1]
-            endpoint = f"github/{owner}/{repo}"
-        elif platform == 'gitlab':
-            if not repo_url.startswith('https://gitlab.com/'):
-                raise ValueError("GitLab repository URL must start with https://gitlab.com/")
-            parts = repo_url.replace('https://gitlab.com/', '').split('/')
-            if len(parts) < 2:
-                raise ValueError("Invalid GitLab repository URL format")
-            owner, repo = parts[0], parts[1]
-            endpoint = f"gitlab/{owner}/{repo}"
-        elif platform == 'bitbucket':
-            if not repo_url.startswith('https://bitbucket.org/'):
-                raise ValueError("Bitbucket repository URL must start with https://bitbucket.org/")
-            parts = repo_url.replace('https://bitbucket.org/', '').split('/')
-            if len(parts) < 2:
-                raise ValueError("Invalid Bitbucket repository URL format")
-            owner, repo = parts[0], parts[1]
-            endpoint = f"bitbucket/{owner}/{repo}"
-        
+
+        # Extract owner/repo from URL; partition stops at the first slash
+        # instead of splitting (and allocating) the whole remaining path
+        display_name, prefix = host
+        if not repo_url.startswith(prefix):
+            raise ValueError(f"{display_name} repository URL must start with {prefix}")
+        owner, sep, tail = repo_url[len(prefix):].partition('/')
+        repo, _, _ = tail.partition('/')
+        if not sep or not repo:
+            raise ValueError(f"Invalid {display_name} repository URL format")
+        endpoint = f"{platform}/{owner}/{repo}"
+
         data = await self._make_request("GET", endpoint)
         
         try:
@@ -4,199 +4,552 @@ Data models for the Libraries.io MCP Server.
 This module contains Pydantic models for data validation and serialization.
 """
 
-from typing import List, Optional, Dict, Any
+import sys
+
+from typing import List, Optional, Dict, Any, Tuple, Annotated
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+# Counts are non-negative and always arrive as JSON numbers, so strict=True
+# lets pydantic-core use its no-coercion int validator; sharing one Annotated
+# alias shares one compiled validator across every count field.
+NonNegInt = Annotated[int, Field(ge=0, strict=True)]
+
+
+# Field documentation sidecar: keeping descriptions out of FieldInfo keeps
+# the compiled schemas lean; model_json_schema() re-injects them on demand.
+_FIELD_DOCS: Dict[str, Dict[str, str]] = {
+    'Platform': {
+        'name': "Name of the platform/package manager",
+        'project_count': "Number of projects on this platform",
+        'homepage': "Homepage URL for the platform",
+        'color': "Hex color code for the platform",
+        'default_language': "Default programming language",
+        'package_type': "Type of packages (library, framework, etc.)",
+    },
+    'PackageVersion': {
+        'number': "Version number",
+        'published_at': "Publication date",
+        'spdx_expression': "SPDX license expression",
+        'original_license': "Original license string",
+        'status': "Version status (active, deprecated, etc.)",
+    },
+    'Package': {
+        'name': "Package name",
+        'platform': "Platform/package manager",
+        'description': "Package description",
+        'homepage': "Homepage URL",
+        'repository_url': "Repository URL",
+        'language': "Primary programming language",
+        'keywords': "Package keywords",
+        'licenses': "License information",
+        'latest_release_number': "Latest version number",
+        'latest_release_published_at': "Latest version publication date",
+        'stars': "Number of stars on repository",
+        'forks': "Number of forks",
+        'dependents_count': "Number of dependent packages",
+        'versions': "Available versions",
+        'status': "Package status",
+    },
+    'Dependency': {
+        'name': "Dependency name",
+        'platform': "Dependency platform",
+        'requirement': "Version requirement",
+        'kind': "Dependency kind (runtime, development, etc.)",
+        'optional': "Whether dependency is optional",
+    },
+    'Repository': {
+        'url': "Repository URL",
+        'homepage': "Homepage URL",
+        'description': "Repository description",
+        'language': "Primary programming language",
+        'stars': "Number of stars",
+        'forks': "Number of forks",
+        'last_commit_at': "Last commit date",
+        'package_count': "Number of packages from this repo",
+    },
+    'User': {
+        'username': "Username",
+        'name': "Display name",
+        'email': "Email address",
+        'company': "Company",
+        'location': "Location",
+        'blog': "Blog URL",
+        'bio': "Biography",
+        'avatar_url': "Avatar URL",
+        'followers_count': "Number of followers",
+        'following_count': "Number of following",
+        'public_gists_count': "Number of public gists",
+        'public_repos_count': "Number of public repositories",
+    },
+    'Organization': {
+        'login': "Organization login",
+        'name': "Display name",
+        'description': "Organization description",
+        'company': "Company",
+        'location': "Location",
+        'blog': "Blog URL",
+        'email': "Email address",
+        'avatar_url': "Avatar URL",
+        'followers_count': "Number of followers",
+        'following_count': "Number of following",
+        'public_gists_count': "Number of public gists",
+        'public_repos_count': "Number of public repositories",
+        'created_at': "Creation date",
+        'updated_at': "Last update date",
+    },
+    'SearchResult': {
+        'total_count': "Total number of results",
+        'incomplete_results': "Whether results are incomplete",
+        'items': "Search result items",
+    },
+    'APIError': {
+        'message': "Error message",
+        'status_code': "HTTP status code",
+        'documentation_url': "URL to documentation",
+        'errors': "Detailed error list",
+    },
+    'RateLimitInfo': {
+        'limit': "Rate limit limit",
+        'remaining': "Rate limit remaining",
+        'reset': "Rate limit reset time",
+        'used': "Rate limit used",
+    },
+    'PlatformsResponse': {
+        'platforms': "List of supported platforms",
+    },
+    'PackageResponse': {
+        'package': "Package information",
+    },
+    'DependenciesResponse': {
+        'dependencies': "List of dependencies",
+    },
+    'DependentsResponse': {
+        'dependents': "List of dependent packages",
+    },
+    'UserResponse': {
+        'user': "User information",
+    },
+    'OrganizationResponse': {
+        'organization': "Organization information",
+    },
+    'RepositoryResponse': {
+        'repository': "Repository information",
+    },
+}
+
+
+def _inject_field_docs(schema: Dict[str, Any], root_name: str) -> None:
+    """Reattach sidecar descriptions to a generated JSON schema in place."""
+    targets = {root_name: schema}
+    targets.update(schema.get('$defs', {}))
+    for name, subschema in targets.items():
+        field_docs = _FIELD_DOCS.get(name)
+        if not field_docs:
+            continue
+        for field, prop in subschema.get('properties', {}).items():
+            if field in field_docs:
+                prop.setdefault('description', field_docs[field])
+
+
+class _ApiModel(BaseModel):
+    """Base for API models; field docs live in _FIELD_DOCS, not FieldInfo."""
+
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        schema = super().model_json_schema(*args, **kwargs)
+        _inject_field_docs(schema, cls.__name__)
+        return schema
+
+
+def dump_response(model: BaseModel) -> bytes:
+    """
+    Serialize a response model to compact JSON bytes.
+
+    Uses orjson on the dumped dict when available (tight C loop over
+    dicts/lists beats the schema walk on large list-of-Package payloads),
+    falling back to pydantic's own serializer. ``exclude_none`` trims the
+    many unset Optional fields these models carry.
+    """
+    if orjson is not None:
+        return orjson.dumps(model.model_dump(mode='json', exclude_none=True))
+    return model.model_dump_json(exclude_none=True).encode()
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_datetime(raw: str) -> datetime:
+    """Parse an ISO-8601 timestamp, memoized since timestamps repeat across pages."""
+    return datetime.fromisoformat(raw.replace('Z', '+00:00'))
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp from the API, passing through None/datetime."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return _parse_iso_datetime(value)
+
+
+class Platform(_ApiModel):
+    """Model for a supported package manager/platform."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
-class Platform(BaseModel):
-    """Model for a supported package manager/platform."""
-    
-    name: str = Field(..., description="Name of the platform/package manager")
-    project_count: int = Field(..., description="Number of projects on this platform")
-    homepage: str = Field(..., description="Homepage URL for the platform")
-    color: str = Field(..., description="Hex color code for the platform")
-    default_language: Optional[str] = Field(None, description="Default programming language")
-    package_type: Optional[str] = Field(None, description="Type of packages (library, framework, etc.)")
+    name: str
+    project_count: NonNegInt
+    homepage: str
+    color: str
+    default_language: Optional[str] = None
+    package_type: Optional[str] = None
 
 
-class PackageVersion(BaseModel):
+class PackageVersion(_ApiModel):
     """Model for a package version."""
-    
-    number: str = Field(..., description="Version number")
-    published_at: Optional[datetime] = Field(None, description="Publication date")
-    spdx_expression: Optional[str] = Field(None, description="SPDX license expression")
-    original_license: Optional[str] = Field(None, description="Original license string")
-    status: Optional[str] = Field(None, description="Version status (active, deprecated, etc.)")
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    number: str
+    published_at: Optional[datetime] = None
+    spdx_expression: Optional[str] = None
+    original_license: Optional[str] = None
+    status: Optional[str] = None
 
-class Package(BaseModel):
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "PackageVersion":
+        """Build from a trusted API payload, skipping schema validation."""
+        values = {k: v for k, v in data.items() if k in cls.model_fields}
+        if values.get('published_at') is not None:
+            values['published_at'] = _parse_datetime(values['published_at'])
+        return cls.model_construct(**values)
+
+
+class Package(_ApiModel):
     """Model for a package/project."""
-    
-    name: str = Field(..., description="Package name")
-    platform: str = Field(..., description="Platform/package manager")
-    description: Optional[str] = Field(None, description="Package description")
-    homepage: Optional[str] = Field(None, description="Homepage URL")
-    repository_url: Optional[str] = Field(None, description="Repository URL")
-    language: Optional[str] = Field(None, description="Primary programming language")
-    keywords: List[str] = Field(default_factory=list, description="Package keywords")
-    licenses: Optional[str] = Field(None, description="License information")
-    latest_release_number: Optional[str] = Field(None, description="Latest version number")
-    latest_release_published_at: Optional[datetime] = Field(None, description="Latest version publication date")
-    stars: Optional[int] = Field(None, description="Number of stars on repository")
-    forks: Optional[int] = Field(None, description="Number of forks")
-    dependents_count: int = Field(default=0, description="Number of dependent packages")
-    versions: List[PackageVersion] = Field(default_factory=list, description="Available versions")
-    status: Optional[str] = Field(None, description="Package status")
-
-
-class Dependency(BaseModel):
-    """Model for a package dependency."""
-    
-    name: str = Field(..., description="Dependency name")
-    platform: str = Field(..., description="Dependency platform")
-    requirement: Optional[str] = Field(None, description="Version requirement")
-    kind: Optional[str] = Field(None, description="Dependency kind (runtime, development, etc.)")
-    optional: bool = Field(default=False, description="Whether dependency is optional")
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    name: str
+    platform: str
+    description: Optional[str] = None
+    homepage: Optional[str] = None
+    repository_url: Optional[str] = None
+    language: Optional[str] = None
+    keywords: List[str] = []
+    licenses: Optional[str] = None
+    latest_release_number: Optional[str] = None
+    latest_release_published_at: Optional[datetime] = None
+    stars: Optional[NonNegInt] = None
+    forks: Optional[NonNegInt] = None
+    dependents_count: NonNegInt = 0
+    versions: List[PackageVersion] = []
+    status: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Package":
+        """
+        Build from a trusted API payload, skipping schema validation.
+
+        Libraries.io responses are already well-typed, so the wire path uses
+        ``model_construct`` and only converts the fields whose Python type
+        differs from the JSON one (timestamps and nested versions). Use
+        ``model_validate`` for data from untrusted callers.
+        """
+        values = {k: v for k, v in data.items() if k in cls.model_fields}
+        if isinstance(values.get('platform'), str):
+            values['platform'] = sys.intern(values['platform'])
+        if values.get('latest_release_published_at') is not None:
+            values['latest_release_published_at'] = _parse_datetime(
+                values['latest_release_published_at']
+            )
+        if values.get('versions'):
+            values['versions'] = [
+                v if isinstance(v, PackageVersion) else PackageVersion.from_api(v)
+                for v in values['versions']
+            ]
+        return cls.model_construct(**values)
+
+
+class Dependency(_ApiModel):
+    """Model for a package dependency."""
 
-class Repository(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    name: str
+    platform: str
+    requirement: Optional[str] = None
+    kind: Optional[str] = None
+    optional: bool = False
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Dependency":
+        """
+        Build from a trusted API payload, skipping schema validation.
+
+        ``platform`` and ``kind`` come from tiny closed vocabularies
+        (npm/pypi/..., runtime/development/...), so they are interned to
+        share one string object across the hundreds of dependencies a
+        single response can carry.
+        """
+        values = {k: v for k, v in data.items() if k in cls.model_fields}
+        if isinstance(values.get('platform'), str):
+            values['platform'] = sys.intern(values['platform'])
+        if isinstance(values.get('kind'), str):
+            values['kind'] = sys.intern(values['kind'])
+        return cls.model_construct(**values)
+
+
+class Repository(_ApiModel):
     """Model for a repository."""
-    
-    url: str = Field(..., description="Repository URL")
-    homepage: Optional[str] = Field(None, description="Homepage URL")
-    description: Optional[str] = Field(None, description="Repository description")
-    language: Optional[str] = Field(None, description="Primary programming language")
-    stars: Optional[int] = Field(None, description="Number of stars")
-    forks: Optional[int] = Field(None, description="Number of forks")
-    last_commit_at: Optional[datetime] = Field(None, description="Last commit date")
-    package_count: Optional[int] = Field(None, description="Number of packages from this repo")
-
-
-class User(BaseModel):
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    url: str
+    homepage: Optional[str] = None
+    description: Optional[str] = None
+    language: Optional[str] = None
+    stars: Optional[NonNegInt] = None
+    forks: Optional[NonNegInt] = None
+    last_commit_at: Optional[datetime] = None
+    package_count: Optional[NonNegInt] = None
+
+
+class User(_ApiModel):
     """Model for a user."""
-    
-    username: str = Field(..., description="Username")
-    name: Optional[str] = Field(None, description="Display name")
-    email: Optional[str] = Field(None, description="Email address")
-    company: Optional[str] = Field(None, description="Company")
-    location: Optional[str] = Field(None, description="Location")
-    blog: Optional[str] = Field(None, description="Blog URL")
-    bio: Optional[str] = Field(None, description="Biography")
-    avatar_url: Optional[str] = Field(None, description="Avatar URL")
-    followers_count: Optional[int] = Field(None, description="Number of followers")
-    following_count: Optional[int] = Field(None, description="Number of following")
-    public_gists_count: Optional[int] = Field(None, description="Number of public gists")
-    public_repos_count: Optional[int] = Field(None, description="Number of public repositories")
-
-
-class Organization(BaseModel):
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    username: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    blog: Optional[str] = None
+    bio: Optional[str] = None
+    avatar_url: Optional[str] = None
+    followers_count: Optional[NonNegInt] = None
+    following_count: Optional[NonNegInt] = None
+    public_gists_count: Optional[NonNegInt] = None
+    public_repos_count: Optional[NonNegInt] = None
+
+
+class Organization(_ApiModel):
     """Model for an organization."""
-    
-    login: str = Field(..., description="Organization login")
-    name: Optional[str] = Field(None, description="Display name")
-    description: Optional[str] = Field(None, description="Organization description")
-    company: Optional[str] = Field(None, description="Company")
-    location: Optional[str] = Field(None, description="Location")
-    blog: Optional[str] = Field(None, description="Blog URL")
-    email: Optional[str] = Field(None, description="Email address")
-    avatar_url: Optional[str] = Field(None, description="Avatar URL")
-    followers_count: Optional[int] = Field(None, description="Number of followers")
-    following_count: Optional[int] = Field(None, description="Number of following")
-    public_gists_count: Optional[int] = Field(None, description="Number of public gists")
-    public_repos_count: Optional[int] = Field(None, description="Number of public repositories")
-    created_at: Optional[datetime] = Field(None, description="Creation date")
-    updated_at: Optional[datetime] = Field(None, description="Last update date")
-
-
-class SearchResult(BaseModel):
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    login: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    blog: Optional[str] = None
+    email: Optional[str] = None
+    avatar_url: Optional[str] = None
+    followers_count: Optional[NonNegInt] = None
+    following_count: Optional[NonNegInt] = None
+    public_gists_count: Optional[NonNegInt] = None
+    public_repos_count: Optional[NonNegInt] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class SearchResult(_ApiModel):
     """Model for search results."""
-    
-    total_count: int = Field(..., description="Total number of results")
-    incomplete_results: bool = Field(..., description="Whether results are incomplete")
-    items: List[Package] = Field(..., description="Search result items")
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    total_count: NonNegInt
+    incomplete_results: bool
+    items: Tuple[Package, ...]
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "SearchResult":
+        """Build from a trusted API payload, skipping schema validation."""
+        return cls.model_construct(
+            total_count=data.get('total_count', 0),
+            incomplete_results=data.get('incomplete_results', False),
+            items=tuple(Package.from_api(d) for d in data.get('items', ())),
+        )
 
-class APIError(BaseModel):
+
+class APIError(_ApiModel):
     """Model for API errors."""
-    
-    message: str = Field(..., description="Error message")
-    status_code: int = Field(..., description="HTTP status code")
-    documentation_url: Optional[str] = Field(None, description="URL to documentation")
-    errors: Optional[List[str]] = Field(None, description="Detailed error list")
 
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    message: str
+    status_code: NonNegInt
+    documentation_url: Optional[str] = None
+    errors: Optional[List[str]] = None
 
-class RateLimitInfo(BaseModel):
+
+class RateLimitInfo(_ApiModel):
     """Model for rate limit information."""
-    
-    limit: int = Field(..., description="Rate limit limit")
-    remaining: int = Field(..., description="Rate limit remaining")
-    reset: Optional[datetime] = Field(None, description="Rate limit reset time")
-    used: int = Field(..., description="Rate limit used")
 
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
-# Response wrapper models
-class PaginatedResponse(BaseModel):
-    """Base model for paginated responses."""
-    
-    total_count: int = Field(..., description="Total number of items")
-    page: int = Field(..., description="Current page number")
-    per_page: int = Field(..., description="Items per page")
-    items: List[Any] = Field(..., description="Response items")
+    limit: int
+    remaining: int
+    reset: Optional[datetime] = None
+    used: int
 
 
-class PlatformsResponse(BaseModel):
+# Response wrapper models
+class PlatformsResponse(_ApiModel):
     """Response model for platforms endpoint."""
-    
-    platforms: List[Platform] = Field(..., description="List of supported platforms")
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    platforms: Tuple[Platform, ...]
 
-class PackageResponse(BaseModel):
+
+class PackageResponse(_ApiModel):
     """Response model for package endpoint."""
-    
-    package: Package = Field(..., description="Package information")
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    package: Package
 
-class DependenciesResponse(BaseModel):
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "PackageResponse":
+        """Build from a trusted API payload, skipping schema validation."""
+        return cls.model_construct(package=Package.from_api(data['package']))
+
+
+class DependenciesResponse(_ApiModel):
     """Response model for dependencies endpoint."""
-    
-    dependencies: List[Dependency] = Field(..., description="List of dependencies")
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    dependencies: Tuple[Dependency, ...]
 
-class DependentsResponse(BaseModel):
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "DependenciesResponse":
+        """Build from a trusted API payload, skipping schema validation."""
+        return cls.model_construct(dependencies=tuple(
+            Dependency.from_api(d) for d in data.get('dependencies', ())
+        ))
+
+
+class DependentsResponse(_ApiModel):
     """Response model for dependents endpoint."""
-    
-    dependents: List[Package] = Field(..., description="List of dependent packages")
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    dependents: Tuple[Package, ...]
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "DependentsResponse":
+        """Build from a trusted API payload, skipping schema validation."""
+        return cls.model_construct(dependents=tuple(
+            Package.from_api(d) for d in data.get('dependents', ())
+        ))
 
-class SearchResponse(BaseModel):
-    """Response model for search endpoint."""
-    
-    total_count: int = Field(..., description="Total number of results")
-    incomplete_results: bool = Field(..., description="Whether results are incomplete")
-    items: List[Package] = Field(..., description="Search result items")
 
+# SearchResponse carried exactly the same fields as SearchResult; aliasing
+# instead of redeclaring avoids compiling a second identical pydantic-core
+# schema at import.
+SearchResponse = SearchResult
 
-class UserResponse(BaseModel):
+
+class UserResponse(_ApiModel):
     """Response model for user endpoint."""
-    
-    user: User = Field(..., description="User information")
 
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    user: User
 
-class OrganizationResponse(BaseModel):
+
+class OrganizationResponse(_ApiModel):
     """Response model for organization endpoint."""
-    
-    organization: Organization = Field(..., description="Organization information")
 
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    organization: Organization
 
-class RepositoryResponse(BaseModel):
+
+class RepositoryResponse(_ApiModel):
     """Response model for repository endpoint."""
-    
-    repository: Repository = Field(..., description="Repository information")
+
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    repository: Repository
+
+
+# Prebuilt bulk validators. TypeAdapter compiles its schema once at import,
+# so the hot list endpoints reuse a single validator instead of paying
+# schema dispatch per call.
+_PLATFORM_LIST_ADAPTER = TypeAdapter(List[Platform])
+_VERSION_LIST_ADAPTER = TypeAdapter(List[PackageVersion])
+_PACKAGE_LIST_ADAPTER = TypeAdapter(List[Package])
+_DEPENDENCY_LIST_ADAPTER = TypeAdapter(List[Dependency])
+
+
+def validate_platform_list(raw: Any) -> List[Platform]:
+    """Validate a list-of-Platform payload (bytes/str stay in pydantic-core)."""
+    if isinstance(raw, (bytes, str)):
+        return _PLATFORM_LIST_ADAPTER.validate_json(raw)
+    return _PLATFORM_LIST_ADAPTER.validate_python(raw)
+
+
+def validate_version_list(raw: Any) -> List[PackageVersion]:
+    """Validate a list-of-PackageVersion payload (bytes/str stay in pydantic-core)."""
+    if isinstance(raw, (bytes, str)):
+        return _VERSION_LIST_ADAPTER.validate_json(raw)
+    return _VERSION_LIST_ADAPTER.validate_python(raw)
+
+
+def validate_package_list(raw: Any) -> List[Package]:
+    """Validate a list-of-Package payload (bytes/str stay in pydantic-core)."""
+    if isinstance(raw, (bytes, str)):
+        return _PACKAGE_LIST_ADAPTER.validate_json(raw)
+    return _PACKAGE_LIST_ADAPTER.validate_python(raw)
+
+
+def validate_dependency_list(raw: Any) -> List[Dependency]:
+    """Validate a list-of-Dependency payload (bytes/str stay in pydantic-core)."""
+    if isinstance(raw, (bytes, str)):
+        return _DEPENDENCY_LIST_ADAPTER.validate_json(raw)
+    return _DEPENDENCY_LIST_ADAPTER.validate_python(raw)
+
+
+def dump_platform_list(platforms: Any) -> List[Dict[str, Any]]:
+    """Dump Platform models to dicts in one pydantic-core pass."""
+    return _PLATFORM_LIST_ADAPTER.dump_python(list(platforms))
+
+
+def dump_version_list(versions: Any) -> List[Dict[str, Any]]:
+    """Dump PackageVersion models to dicts in one pydantic-core pass."""
+    return _VERSION_LIST_ADAPTER.dump_python(list(versions))
+
+
+def dump_package_list(packages: Any) -> List[Dict[str, Any]]:
+    """Dump Package models to dicts in one pydantic-core pass."""
+    return _PACKAGE_LIST_ADAPTER.dump_python(list(packages))
+
+
+def dump_dependency_list(dependencies: Any) -> List[Dict[str, Any]]:
+    """Dump Dependency models to dicts in one pydantic-core pass."""
+    return _DEPENDENCY_LIST_ADAPTER.dump_python(list(dependencies))
 
 
 __all__ = [
+    "dump_response",
+    "validate_platform_list",
+    "validate_version_list",
+    "validate_package_list",
+    "validate_dependency_list",
+    "dump_platform_list",
+    "dump_version_list",
+    "dump_package_list",
+    "dump_dependency_list",
     "Platform",
     "PackageVersion", 
     "Package",
@@ -207,7 +560,6 @@ __all__ = [
     "SearchResult",
     "APIError",
     "RateLimitInfo",
-    "PaginatedResponse",
     "PlatformsResponse",
     "PackageResponse",
     "DependenciesResponse",
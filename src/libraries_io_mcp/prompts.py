@@ -6,34 +6,46 @@ This module contains MCP prompt implementations for Libraries.io data.
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Callable, Dict
+
 from fastmcp import FastMCP
 from .client import LibrariesIOClient
 
 
-def register_prompts(server: FastMCP, client: LibrariesIOClient) -> None:
+
+def _render_dependency_list(deps) -> str:
+    """Render dependencies as a bullet list (more readable than list repr)."""
+    return "\n".join(f"  - {dep}" for dep in deps)
+
+
+_render_dependency_list_cached = lru_cache(maxsize=256)(_render_dependency_list)
+
+
+
+def _format_dependencies(dependencies: list) -> str:
     """
-    Register all MCP prompts with the server.
-    
-    Args:
-        server: FastMCP server instance
-        client: LibrariesIOClient instance
+    Format a dependency list for prompt interpolation.
+
+    The same dependency set is often audited repeatedly (CI loops), so the
+    rendering is memoized on a tuple key. Very large or unhashable lists
+    fall through to a direct render to bound cache memory.
     """
-    
-    @server.prompt()
-    async def package_analysis_prompt(platform: str, name: str) -> str:
-        """
-        Generate a prompt for comprehensive package analysis.
-        
-        Args:
-            platform: Package manager platform (e.g., 'npm', 'pypi')
-            name: Package name
-            
-        Returns:
-            Analysis prompt string
-        """
-        return f"""
+    if len(dependencies) <= 1000:
+        try:
+            return _render_dependency_list_cached(tuple(dependencies))
+        except TypeError:
+            pass
+    return _render_dependency_list(dependencies)
+
+
+# Prompt templates, hoisted to module constants so each invocation performs a
+# single C-level format_map over a prebuilt string instead of re-assembling a
+# multi-segment f-string inside the closure.
+
+_PACKAGE_ANALYSIS_TPL = """
         Analyze the package {name} from {platform}.
-        
+
         Please provide a comprehensive analysis including:
         1. Package overview and description
         2. Version history and stability
@@ -41,77 +53,38 @@ def register_prompts(server: FastMCP, client: LibrariesIOClient) -> None:
         4. Popularity metrics (downloads, stars, etc.)
         5. Security considerations
         6. Alternative packages
-        
+
         Use the available tools to gather detailed information about this package.
         """
-    
-    @server.prompt()
-    async def dependency_analysis_prompt(platform: str, name: str, version: str | None = None) -> str:
-        """
-        Generate a prompt for dependency analysis.
-        
-        Args:
-            platform: Package manager platform (e.g., 'npm', 'pypi')
-            name: Package name
-            version: Specific version (optional)
-            
-        Returns:
-            Dependency analysis prompt string
-        """
-        version_info = f" version {version}" if version else ""
-        return f"""
+
+_DEPENDENCY_ANALYSIS_TPL = """
         Analyze the dependency tree for {name}{version_info} from {platform}.
-        
+
         Please provide:
         1. Complete dependency tree visualization
         2. License compatibility analysis
         3. Security vulnerabilities in dependencies
         4. Potential update opportunities
         5. Dependency bloat analysis
-        
+
         Use the available tools to explore the full dependency structure.
         """
-    
-    @server.prompt()
-    async def ecosystem_exploration_prompt(platform: str, language: str | None = None) -> str:
-        """
-        Generate a prompt for ecosystem exploration.
-        
-        Args:
-            platform: Package manager platform (e.g., 'npm', 'pypi')
-            language: Programming language filter (optional)
-            
-        Returns:
-            Ecosystem exploration prompt string
-        """
-        lang_info = f" for {language}" if language else ""
-        return f"""
+
+_ECOSYSTEM_EXPLORATION_TPL = """
         Explore the {platform} ecosystem{lang_info}.
-        
+
         Please provide:
         1. Overview of popular packages and trends
         2. Platform statistics and health metrics
         3. Emerging packages and technologies
         4. Best practices and recommendations
-        
+
         Use the available tools to gather comprehensive ecosystem data.
         """
 
-    @server.prompt()
-    async def evaluate_package(package_name: str, platform: str = "npm") -> str:
-        """
-        Generate a prompt for comprehensive package evaluation.
-        
-        Args:
-            package_name: Name of the package to evaluate
-            platform: Package manager platform (default: "npm")
-            
-        Returns:
-            Package evaluation prompt string
-        """
-        return f"""
+_EVALUATE_PACKAGE_TPL = """
         Evaluate the open source package '{package_name}' on {platform}.
-        
+
         Please analyze:
         1. Package popularity and community adoption
         2. Maintenance status and update frequency
@@ -119,50 +92,27 @@ def register_prompts(server: FastMCP, client: LibrariesIOClient) -> None:
         4. License and legal compliance
         5. Dependencies and potential risks
         6. Alternatives and recommendations
-        
+
         Provide a comprehensive evaluation with recommendations.
         """
 
-    @server.prompt()
-    async def audit_dependencies(dependencies: list) -> str:
-        """
-        Generate a prompt for dependency audit.
-        
-        Args:
-            dependencies: List of dependencies to audit
-            
-        Returns:
-            Dependency audit prompt string
-        """
-        return f"""
+_AUDIT_DEPENDENCIES_TPL = """
         Perform a security and maintenance audit of these dependencies:
         {dependencies}
-        
+
         For each dependency, check:
         - Security vulnerabilities
         - Maintenance status
         - License compliance
         - Outdated versions
         - Potential replacements
-        
+
         Provide actionable recommendations for improving the dependency stack.
         """
 
-    @server.prompt()
-    async def analyze_project_health(project_name: str, platform: str = "npm") -> str:
-        """
-        Generate a prompt for project health analysis.
-        
-        Args:
-            project_name: Name of the project to analyze
-            platform: Package manager platform (default: "npm")
-            
-        Returns:
-            Project health analysis prompt string
-        """
-        return f"""
+_PROJECT_HEALTH_TPL = """
         Analyze the overall health of project '{project_name}' on {platform}.
-        
+
         Please provide a comprehensive health assessment including:
         1. Dependency tree analysis and complexity
         2. Security vulnerability summary
@@ -171,35 +121,15 @@ def register_prompts(server: FastMCP, client: LibrariesIOClient) -> None:
         5. Update opportunities and outdated packages
         6. Performance impact analysis
         7. Risk assessment and recommendations
-        
+
         Use the available tools to gather comprehensive project data and provide
         actionable insights for improving project health.
         """
 
-    @server.prompt()
-    async def recommend_packages(
-        requirements: str,
-        platform: str = "npm",
-        language: str | None = None,
-        limit: int = 10
-    ) -> str:
-        """
-        Generate a prompt for package recommendations.
-        
-        Args:
-            requirements: Description of requirements or use case
-            platform: Package manager platform (default: "npm")
-            language: Programming language filter (optional)
-            limit: Maximum number of recommendations (default: 10)
-            
-        Returns:
-            Package recommendation prompt string
-        """
-        lang_info = f" for {language}" if language else ""
-        return f"""
+_RECOMMEND_PACKAGES_TPL = """
         Recommend packages on {platform}{lang_info} based on these requirements:
         {requirements}
-        
+
         Please provide:
         1. Top {limit} recommended packages with detailed justifications
         2. Each package's key features and benefits
@@ -209,34 +139,15 @@ def register_prompts(server: FastMCP, client: LibrariesIOClient) -> None:
         6. Security considerations and vulnerability history
         7. Performance characteristics
         8. Comparison with alternatives
-        
+
         Use the available tools to search and analyze packages that best match
         the specified requirements.
         """
 
-    @server.prompt()
-    async def migration_guide(
-        package_name: str,
-        current_version: str,
-        target_version: str,
-        platform: str = "npm"
-    ) -> str:
-        """
-        Generate a prompt for package migration guide.
-        
-        Args:
-            package_name: Name of the package to migrate
-            current_version: Current version to migrate from
-            target_version: Target version to migrate to
-            platform: Package manager platform (default: "npm")
-            
-        Returns:
-            Migration guide prompt string
-        """
-        return f"""
+_MIGRATION_GUIDE_TPL = """
         Create a comprehensive migration guide for '{package_name}' from version
         {current_version} to {target_version} on {platform}.
-        
+
         Please provide:
         1. Version differences and breaking changes
         2. API changes and deprecations
@@ -248,33 +159,15 @@ def register_prompts(server: FastMCP, client: LibrariesIOClient) -> None:
         8. Performance considerations
         9. Security implications
         10. Migration timeline and effort estimation
-        
+
         Use the available tools to gather detailed version information and
         provide actionable migration guidance.
         """
 
-    @server.prompt()
-    async def security_assessment(
-        project_name: str,
-        platform: str = "npm",
-        include_dependencies: bool = True
-    ) -> str:
-        """
-        Generate a prompt for security assessment.
-        
-        Args:
-            project_name: Name of the project to assess
-            platform: Package manager platform (default: "npm")
-            include_dependencies: Whether to include dependency analysis (default: True)
-            
-        Returns:
-            Security assessment prompt string
-        """
-        scope = "including all dependencies" if include_dependencies else "for the main package"
-        return f"""
+_SECURITY_ASSESSMENT_TPL = """
         Perform a comprehensive security assessment for project '{project_name}'
         on {platform} {scope}.
-        
+
         Please analyze:
         1. Known security vulnerabilities in the package(s)
         2. Dependency security risks and vulnerabilities
@@ -285,32 +178,17 @@ def register_prompts(server: FastMCP, client: LibrariesIOClient) -> None:
         7. Security rating and risk score
         8. Immediate action items and recommendations
         9. Long-term security maintenance strategy
-        
+
         Use the available tools to gather security data and provide
         prioritized recommendations for risk mitigation.
         """
 
-    @server.prompt()
-    async def license_compliance_check(
-        dependencies: list,
-        policy_requirements: str = "permissive"
-    ) -> str:
-        """
-        Generate a prompt for license compliance checking.
-        
-        Args:
-            dependencies: List of dependencies to check
-            policy_requirements: License policy requirements (default: "permissive")
-            
-        Returns:
-            License compliance check prompt string
-        """
-        return f"""
+_LICENSE_COMPLIANCE_TPL = """
         Perform a comprehensive license compliance check for these dependencies:
         {dependencies}
-        
+
         Based on the policy requirements: {policy_requirements}
-        
+
         Please analyze:
         1. License compatibility matrix
         2. License obligations and restrictions
@@ -322,32 +200,15 @@ def register_prompts(server: FastMCP, client: LibrariesIOClient) -> None:
         8. Compliance gaps and violations
         9. Recommended license alternatives
         10. Legal review recommendations
-        
+
         Use the available tools to gather license information and provide
         actionable compliance guidance.
         """
 
-    @server.prompt()
-    async def maintenance_status_report(
-        project_name: str,
-        platform: str = "npm",
-        time_period: str = "6 months"
-    ) -> str:
-        """
-        Generate a prompt for maintenance status report.
-        
-        Args:
-            project_name: Name of the project to analyze
-            platform: Package manager platform (default: "npm")
-            time_period: Time period for analysis (default: "6 months")
-            
-        Returns:
-            Maintenance status report prompt string
-        """
-        return f"""
+_MAINTENANCE_STATUS_TPL = """
         Generate a comprehensive maintenance status report for project '{project_name}'
         on {platform} over the last {time_period}.
-        
+
         Please provide:
         1. Update frequency and release cadence
         2. Version stability and changelog analysis
@@ -359,12 +220,261 @@ def register_prompts(server: FastMCP, client: LibrariesIOClient) -> None:
         8. Risk factors and warning signs
         9. Maintenance recommendations
         10. Future outlook and predictions
-        
+
         Use the available tools to gather maintenance data and provide
         insights into the project's long-term viability.
         """
 
 
+
+def package_analysis_prompt(platform: str, name: str) -> str:
+    """
+    Generate a prompt for comprehensive package analysis.
+
+    Args:
+        platform: Package manager platform (e.g., 'npm', 'pypi')
+        name: Package name
+
+    Returns:
+        Analysis prompt string
+    """
+    return _PACKAGE_ANALYSIS_TPL.format_map({'name': name, 'platform': platform})
+
+
+def dependency_analysis_prompt(platform: str, name: str, version: str | None = None) -> str:
+    """
+    Generate a prompt for dependency analysis.
+
+    Args:
+        platform: Package manager platform (e.g., 'npm', 'pypi')
+        name: Package name
+        version: Specific version (optional)
+
+    Returns:
+        Dependency analysis prompt string
+    """
+    return _DEPENDENCY_ANALYSIS_TPL.format_map({
+        'name': name,
+        'platform': platform,
+        'version_info': f" version {version}" if version else ""
+    })
+
+
+def ecosystem_exploration_prompt(platform: str, language: str | None = None) -> str:
+    """
+    Generate a prompt for ecosystem exploration.
+
+    Args:
+        platform: Package manager platform (e.g., 'npm', 'pypi')
+        language: Programming language filter (optional)
+
+    Returns:
+        Ecosystem exploration prompt string
+    """
+    return _ECOSYSTEM_EXPLORATION_TPL.format_map({
+        'platform': platform,
+        'lang_info': f" for {language}" if language else ""
+    })
+
+
+def evaluate_package(package_name: str, platform: str = "npm") -> str:
+    """
+    Generate a prompt for comprehensive package evaluation.
+
+    Args:
+        package_name: Name of the package to evaluate
+        platform: Package manager platform (default: "npm")
+
+    Returns:
+        Package evaluation prompt string
+    """
+    return _EVALUATE_PACKAGE_TPL.format_map({
+        'package_name': package_name,
+        'platform': platform
+    })
+
+
+def audit_dependencies(dependencies: list) -> str:
+    """
+    Generate a prompt for dependency audit.
+
+    Args:
+        dependencies: List of dependencies to audit
+
+    Returns:
+        Dependency audit prompt string
+    """
+    return _AUDIT_DEPENDENCIES_TPL.format_map({
+        'dependencies': _format_dependencies(dependencies)
+    })
+
+
+def analyze_project_health(project_name: str, platform: str = "npm") -> str:
+    """
+    Generate a prompt for project health analysis.
+
+    Args:
+        project_name: Name of the project to analyze
+        platform: Package manager platform (default: "npm")
+
+    Returns:
+        Project health analysis prompt string
+    """
+    return _PROJECT_HEALTH_TPL.format_map({
+        'project_name': project_name,
+        'platform': platform
+    })
+
+
+def recommend_packages(
+    requirements: str,
+    platform: str = "npm",
+    language: str | None = None,
+    limit: int = 10
+) -> str:
+    """
+    Generate a prompt for package recommendations.
+
+    Args:
+        requirements: Description of requirements or use case
+        platform: Package manager platform (default: "npm")
+        language: Programming language filter (optional)
+        limit: Maximum number of recommendations (default: 10)
+
+    Returns:
+        Package recommendation prompt string
+    """
+    return _RECOMMEND_PACKAGES_TPL.format_map({
+        'requirements': requirements,
+        'platform': platform,
+        'lang_info': f" for {language}" if language else "",
+        'limit': limit
+    })
+
+
+def migration_guide(
+    package_name: str,
+    current_version: str,
+    target_version: str,
+    platform: str = "npm"
+) -> str:
+    """
+    Generate a prompt for package migration guide.
+
+    Args:
+        package_name: Name of the package to migrate
+        current_version: Current version to migrate from
+        target_version: Target version to migrate to
+        platform: Package manager platform (default: "npm")
+
+    Returns:
+        Migration guide prompt string
+    """
+    return _MIGRATION_GUIDE_TPL.format_map({
+        'package_name': package_name,
+        'current_version': current_version,
+        'target_version': target_version,
+        'platform': platform
+    })
+
+
+def security_assessment(
+    project_name: str,
+    platform: str = "npm",
+    include_dependencies: bool = True
+) -> str:
+    """
+    Generate a prompt for security assessment.
+
+    Args:
+        project_name: Name of the project to assess
+        platform: Package manager platform (default: "npm")
+        include_dependencies: Whether to include dependency analysis (default: True)
+
+    Returns:
+        Security assessment prompt string
+    """
+    return _SECURITY_ASSESSMENT_TPL.format_map({
+        'project_name': project_name,
+        'platform': platform,
+        'scope': "including all dependencies" if include_dependencies else "for the main package"
+    })
+
+
+def license_compliance_check(
+    dependencies: list,
+    policy_requirements: str = "permissive"
+) -> str:
+    """
+    Generate a prompt for license compliance checking.
+
+    Args:
+        dependencies: List of dependencies to check
+        policy_requirements: License policy requirements (default: "permissive")
+
+    Returns:
+        License compliance check prompt string
+    """
+    return _LICENSE_COMPLIANCE_TPL.format_map({
+        'dependencies': _format_dependencies(dependencies),
+        'policy_requirements': policy_requirements
+    })
+
+
+def maintenance_status_report(
+    project_name: str,
+    platform: str = "npm",
+    time_period: str = "6 months"
+) -> str:
+    """
+    Generate a prompt for maintenance status report.
+
+    Args:
+        project_name: Name of the project to analyze
+        platform: Package manager platform (default: "npm")
+        time_period: Time period for analysis (default: "6 months")
+
+    Returns:
+        Maintenance status report prompt string
+    """
+    return _MAINTENANCE_STATUS_TPL.format_map({
+        'project_name': project_name,
+        'platform': platform,
+        'time_period': time_period
+    })
+
+
+# Static dispatch table: prompt name -> module-level handler. The
+# handlers are plain functions (no client capture, no closure cells),
+# importable and testable on their own.
+_PROMPTS: Dict[str, Callable[..., str]] = {
+    'package_analysis_prompt': package_analysis_prompt,
+    'dependency_analysis_prompt': dependency_analysis_prompt,
+    'ecosystem_exploration_prompt': ecosystem_exploration_prompt,
+    'evaluate_package': evaluate_package,
+    'audit_dependencies': audit_dependencies,
+    'analyze_project_health': analyze_project_health,
+    'recommend_packages': recommend_packages,
+    'migration_guide': migration_guide,
+    'security_assessment': security_assessment,
+    'license_compliance_check': license_compliance_check,
+    'maintenance_status_report': maintenance_status_report,
+}
+
+
+
+def register_prompts(server: FastMCP, client: LibrariesIOClient) -> None:
+    """
+    Register all MCP prompts with the server.
+
+    Args:
+        server: FastMCP server instance
+        client: LibrariesIOClient instance (unused; prompts are pure)
+    """
+    for fn in _PROMPTS.values():
+        server.prompt(fn)
+
+
 __all__ = [
     "register_prompts",
     "package_analysis_prompt",
@@ -378,4 +488,4 @@ __all__ = [
     "security_assessment",
     "license_compliance_check",
     "maintenance_status_report"
-]
\ No newline at end of file
+]
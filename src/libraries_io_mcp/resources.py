@@ -6,316 +6,551 @@ This module contains MCP resource implementations for Libraries.io data.
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
 import re
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs
 
 from fastmcp import FastMCP
 from .client import LibrariesIOClient
+from .utils import validate_platform, sanitize_package_name
+from .models import (
+    dump_platform_list, dump_version_list, dump_package_list,
+    dump_dependency_list
+)
 
+_log = logging.getLogger(__name__)
 
-def parse_resource_uri(uri: str) -> Dict[str, Any]:
+
+def _log_errors(fmt: str):
+    """
+    Log and re-raise any handler failure with the given %-style message.
+
+    The last ``%s`` in the message receives the exception; the preceding
+    ones receive the handler's leading positional arguments after the
+    client. Centralizing the wrapper keeps the handler bodies free of
+    try/except blocks.
+    """
+    slots = fmt.count("%s") - 1
+
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(client, *args, **kwargs):
+            try:
+                return await fn(client, *args, **kwargs)
+            except Exception as e:
+                _log.error(fmt, *args[:slots], e)
+                raise
+        return wrapper
+    return decorator
+
+
+def _augment_packages(result: Dict[str, Any], path_parts: List[str], netloc: str) -> None:
+    n = len(path_parts)
+    if n >= 3:
+        result["platform"] = path_parts[0]
+        result["name"] = path_parts[1]
+        result["resource_type"] = path_parts[2]
+    elif n >= 2:
+        result["platform"] = path_parts[0]
+        result["name"] = path_parts[1]
+        result["resource_type"] = "info"  # default
+
+
+def _augment_platforms(result: Dict[str, Any], path_parts: List[str], netloc: str) -> None:
+    n = len(path_parts)
+    if n == 1 and path_parts[0] == "supported":
+        result["resource_type"] = "supported"
+        result["platform"] = None
+    elif n >= 1:
+        result["platform"] = path_parts[0]
+        result["resource_type"] = "stats"
+
+
+def _augment_search(result: Dict[str, Any], path_parts: List[str], netloc: str) -> None:
+    result["resource_type"] = path_parts[0] if path_parts else "packages"
+
+
+# Which result key the netloc lands in for the account-style schemes.
+_USERKEY = {"users": "username", "orgs": "org"}
+
+
+def _augment_account(result: Dict[str, Any], path_parts: List[str], netloc: str) -> None:
+    # For users:// and orgs:// schemes, the username/org is in netloc,
+    # resource type in path
+    if netloc:
+        result[_USERKEY[result["scheme"]]] = netloc
+    if path_parts and path_parts[0]:
+        result["resource_type"] = path_parts[0]
+    else:
+        result["resource_type"] = "packages"
+
+
+# Scheme -> handler filling in the scheme-specific keys; a dict jump table
+# instead of an if/elif chain over string comparisons.
+_SCHEME_HANDLERS = {
+    "packages": _augment_packages,
+    "platforms": _augment_platforms,
+    "search": _augment_search,
+    "users": _augment_account,
+    "orgs": _augment_account,
+}
+
+# Note: Libraries.io doesn't have a direct trending endpoint, so trending
+# resources use search with popular keywords as a workaround. Tuples so the
+# lookup allocates nothing per call.
+_TRENDING_QUERIES = {
+    "weekly": ("popular", "trending", "hot"),
+    "monthly": ("popular", "trending", "rising"),
+    "daily": ("trending", "new", "hot"),
+}
+_TRENDING_DEFAULT = ("popular", "trending")
+
+
+@lru_cache(maxsize=256)
+def _split_csv(raw: str) -> tuple:
+    """Split a comma-separated filter string into a reusable tuple."""
+    return tuple(raw.split(','))
+
+
+@dataclass(slots=True, frozen=True)
+class ParsedURI:
+    """
+    Immutable result of :func:`parse_resource_uri`.
+
+    Slotted attribute access replaces per-key dict hashing, and because
+    the instance is frozen the memoized parser can hand the same object
+    to every caller. ``params`` is stored as a tuple of
+    ``(key, values-tuple)`` pairs for the same reason.
+    """
+
+    scheme: str
+    netloc: str
+    path: str
+    params: tuple = ()
+    platform: Optional[str] = None
+    name: Optional[str] = None
+    resource_type: Optional[str] = None
+    username: Optional[str] = None
+    org: Optional[str] = None
+
+
+@lru_cache(maxsize=512)
+def _parse_resource_uri_cached(uri: str) -> ParsedURI:
+    """
+    Parse a resource URI into a shared frozen ParsedURI.
+
+    The MCP server sees the same URIs over and over, so the parse is
+    memoized on the raw string; the result is frozen (params as nested
+    tuples) so cache hits cannot leak shared mutable state. The custom
+    scheme grammar is trivial (scheme://netloc/path?query), so it is split
+    with str.partition instead of the full RFC 3986 machinery.
+    """
+    scheme, sep, rest = uri.partition('://')
+    if not sep or not scheme:
+        raise ValueError(f"Invalid URI format: {uri}")
+    scheme = scheme.lower()
+
+    rest, _, fragment = rest.partition('#')
+    rest, _, query = rest.partition('?')
+    netloc, _, path = rest.partition('/')
+
+    # Trim slash edges with slices only when present; the common already-
+    # canonical path skips the str.strip allocation entirely.
+    if path.startswith('/'):
+        path = path[1:]
+    if path.endswith('/'):
+        path = path[:-1]
+
+    # For custom URI schemes like users://, the netloc might be empty
+    # and the actual data might be in the path
+    result = {
+        "scheme": scheme,
+        "netloc": netloc,
+        "path": path,
+        "params": tuple(
+            (key, tuple(values))
+            for key, values in parse_qs(query).items()
+        ) if query else ()
+    }
+
+    handler = _SCHEME_HANDLERS.get(scheme)
+    if handler is not None:
+        handler(result, path.split('/'), netloc)
+
+    return ParsedURI(**result)
+
+
+def parse_resource_uri(uri: str) -> ParsedURI:
     """
     Parse resource URI and extract parameters.
-    
+
     Args:
         uri: Resource URI (e.g., "packages://npm/react/info")
-        
+
     Returns:
-        Dictionary with parsed parameters
-        
+        ParsedURI with the extracted fields; query parameters are in
+        ``params`` as (key, values-tuple) pairs
+
     Raises:
         ValueError: If URI format is invalid
     """
     try:
-        parsed = urlparse(uri)
-        if not parsed.scheme:
-            raise ValueError(f"Invalid URI format: {uri}")
-        
-        # For custom URI schemes like users://, the netloc might be empty
-        # and the actual data might be in the path
-        if not parsed.netloc and parsed.scheme in ['users', 'orgs', 'packages', 'platforms', 'search']:
-            # For these schemes, the path contains the actual resource identifier
-            result = {
-                "scheme": parsed.scheme,
-                "netloc": "",
-                "path": parsed.path.strip('/'),
-                "params": parse_qs(parsed.query)
-            }
-        else:
-            result = {
-                "scheme": parsed.scheme,
-                "netloc": parsed.netloc,
-                "path": parsed.path.strip('/'),
-                "params": parse_qs(parsed.query)
-            }
-        
-        # Parse path components
-        path_parts = result["path"].split('/')
-        
-        if result["scheme"] == "packages":
-            if len(path_parts) >= 3:
-                result["platform"] = path_parts[0]
-                result["name"] = path_parts[1]
-                result["resource_type"] = path_parts[2]
-            elif len(path_parts) >= 2:
-                result["platform"] = path_parts[0]
-                result["name"] = path_parts[1]
-                result["resource_type"] = "info"  # default
-        
-        elif result["scheme"] == "platforms":
-            if len(path_parts) == 1 and path_parts[0] == "supported":
-                result["resource_type"] = "supported"
-                result["platform"] = None
-            elif len(path_parts) >= 1:
-                result["platform"] = path_parts[0]
-                result["resource_type"] = "stats"
-        
-        elif result["scheme"] == "search":
-            result["resource_type"] = path_parts[0] if path_parts else "packages"
-        
-        elif result["scheme"] in ["users", "orgs"]:
-            # For users:// and orgs:// schemes, the username/org is in netloc, resource type in path
-            if parsed.netloc:
-                result["username" if result["scheme"] == "users" else "org"] = parsed.netloc
-            if path_parts and path_parts[0]:
-                result["resource_type"] = path_parts[0]
-            else:
-                result["resource_type"] = "packages"
-        
-        return result
-        
+        return _parse_resource_uri_cached(uri)
     except Exception as e:
         raise ValueError(f"Failed to parse URI {uri}: {e}")
 
 
-def validate_platform(platform: str) -> bool:
-    """Validate platform name."""
-    from .utils import validate_platform as validate_platform_util
-    return validate_platform_util(platform)
+# Handler bodies live at module level and take the client explicitly, so
+# the coroutines registered below are one-line forwarders closing over a
+# single cell instead of full closures, and the logic is reachable for
+# testing without a FastMCP instance. (functools.partial would drop the
+# closure entirely, but FastMCP's registration introspects __name__ and
+# the signature, which partial objects don't carry.)
+
+@_log_errors("Failed to get supported platforms: %s")
+async def _get_supported_platforms(client: LibrariesIOClient) -> Dict[str, Any]:
+    """Fetch and serialize the supported platforms list."""
+    platforms = await client.get_platforms()
+    return {
+        "resource_type": "platforms",
+        "subtype": "supported",
+        "total_count": len(platforms),
+        "platforms": dump_platform_list(platforms),
+        "source": "libraries.io"
+    }
+
+
+@_log_errors("Failed to get platform stats for %s: %s")
+async def _get_platform_stats(client: LibrariesIOClient, platform: str) -> Dict[str, Any]:
+    """Fetch statistics for one platform."""
+    if not validate_platform(platform):
+        raise ValueError(f"Invalid platform: {platform}")
+
+    # Use the platform stats endpoint from client
+    stats_data = await client._make_request("GET", f"platform/{platform}")
+
+    return {
+        "resource_type": "platforms",
+        "platform": platform,
+        "statistics": stats_data,
+        "source": "libraries.io"
+    }
+
+
+@_log_errors("Failed to get package info for %s/%s: %s")
+async def _get_package_info(client: LibrariesIOClient, platform: str, name: str) -> Dict[str, Any]:
+    """Fetch comprehensive information for one package."""
+    if not validate_platform(platform):
+        raise ValueError(f"Invalid platform: {platform}")
+
+    name = sanitize_package_name(name)
+    package = await client.get_package(platform, name, include_versions=True)
+
+    return {
+        "resource_type": "packages",
+        "platform": platform,
+        "name": name,
+        "package": package.model_dump(),
+        "source": "libraries.io"
+    }
+
+
+@_log_errors("Failed to get package versions for %s/%s: %s")
+async def _get_package_versions(client: LibrariesIOClient, platform: str, name: str) -> Dict[str, Any]:
+    """Fetch the version history for one package."""
+    if not validate_platform(platform):
+        raise ValueError(f"Invalid platform: {platform}")
 
+    name = sanitize_package_name(name)
+    versions = await client.get_package_versions(platform, name)
 
-def sanitize_package_name(name: str) -> str:
-    """Sanitize package name."""
-    from .utils import sanitize_package_name as sanitize_package_name_util
-    return sanitize_package_name_util(name)
+    return {
+        "resource_type": "packages",
+        "platform": platform,
+        "name": name,
+        "versions": dump_version_list(versions),
+        "total_count": len(versions),
+        "source": "libraries.io"
+    }
+
+
+@_log_errors("Failed to get package dependencies for %s/%s: %s")
+async def _get_package_dependencies(client: LibrariesIOClient, platform: str, name: str,
+                                    version: Optional[str] = None) -> Dict[str, Any]:
+    """Fetch the dependencies for one package."""
+    if not validate_platform(platform):
+        raise ValueError(f"Invalid platform: {platform}")
+
+    name = sanitize_package_name(name)
+    dependencies = await client.get_package_dependencies(platform, name, version)
+
+    return {
+        "resource_type": "packages",
+        "platform": platform,
+        "name": name,
+        "version": version,
+        "dependencies": dump_dependency_list(dependencies),
+        "total_count": len(dependencies),
+        "source": "libraries.io"
+    }
+
+
+@_log_errors("Failed to get package dependents for %s/%s: %s")
+async def _get_package_dependents(client: LibrariesIOClient, platform: str, name: str,
+                                  page: int = 1, per_page: int = 100) -> Dict[str, Any]:
+    """Fetch the packages that depend on one package."""
+    if not validate_platform(platform):
+        raise ValueError(f"Invalid platform: {platform}")
+
+    name = sanitize_package_name(name)
+    dependents = await client.get_package_dependents(platform, name, page, per_page)
+
+    return {
+        "resource_type": "packages",
+        "platform": platform,
+        "name": name,
+        "page": page,
+        "per_page": per_page,
+        "dependents": dump_package_list(dependents),
+        "total_count": len(dependents),
+        "source": "libraries.io"
+    }
+
+
+@_log_errors("Failed to search packages with query '%s': %s")
+async def _search_packages(client: LibrariesIOClient, query: str, platforms: Optional[str] = None,
+                           languages: Optional[str] = None, licenses: Optional[str] = None,
+                           page: int = 1, per_page: int = 10) -> Dict[str, Any]:
+    """Run a package search with optional filters."""
+    if not query:
+        raise ValueError("Query parameter 'q' is required")
+
+    # Parse comma-separated values; filter combinations repeat across
+    # requests, so the split tuples are memoized
+    platform_list = _split_csv(platforms) if platforms else None
+    language_list = _split_csv(languages) if languages else None
+    license_list = _split_csv(licenses) if licenses else None
+
+    search_result = await client.search_packages(
+        query=query,
+        platforms=platform_list,
+        languages=language_list,
+        licenses=license_list,
+        page=page,
+        per_page=min(per_page, 100)
+    )
+
+    return {
+        "resource_type": "search",
+        "search_type": "packages",
+        "query": query,
+        "platforms": platform_list,
+        "languages": language_list,
+        "licenses": license_list,
+        "page": page,
+        "per_page": per_page,
+        "total_count": search_result.total_count,
+        "incomplete_results": search_result.incomplete_results,
+        "items": dump_package_list(search_result.items),
+        "source": "libraries.io"
+    }
+
+
+@_log_errors("Failed to get trending packages: %s")
+async def _get_trending_packages(client: LibrariesIOClient, platform: Optional[str] = None,
+                                 period: str = "weekly") -> Dict[str, Any]:
+    """Approximate trending packages via popularity searches."""
+    queries = _TRENDING_QUERIES.get(period.lower(), _TRENDING_DEFAULT)
+
+    # Search for popular packages. The queries are independent, so
+    # they run concurrently and the wall-clock cost is one round
+    # trip instead of three; a failed query degrades to partial
+    # results rather than failing the whole resource.
+    queries = queries[:3]  # Limit to 3 queries to avoid rate limiting
+    per_page = min(20, 100 // len(queries))
+    search_results = await asyncio.gather(
+        *(
+            client.search_packages(
+                query=query,
+                platforms=[platform] if platform else None,
+                page=1,
+                per_page=per_page
+            )
+            for query in queries
+        ),
+        return_exceptions=True
+    )
+
+    # Deduplicate as the results are consumed, keeping the star
+    # count alongside each package so the selection below compares
+    # plain ints
+    unique_results: Dict[tuple, tuple] = {}
+    for query, search_result in zip(queries, search_results):
+        if isinstance(search_result, BaseException):
+            _log.warning("Trending query '%s' failed: %s", query, search_result)
+            continue
+        for pkg in search_result.items:
+            stars = pkg.stars or 0
+            key = (pkg.platform, pkg.name)
+            current = unique_results.get(key)
+            if current is None or stars > current[0]:
+                unique_results[key] = (stars, pkg)
+
+    # Top 50 by stars: nlargest is O(n log 50) and skips sorting
+    # the tail
+    sorted_results = [
+        pkg for _, pkg in heapq.nlargest(
+            50, unique_results.values(), key=itemgetter(0)
+        )
+    ]
+
+    return {
+        "resource_type": "search",
+        "search_type": "trending",
+        "platform": platform,
+        "period": period,
+        "total_count": len(sorted_results),
+        "items": dump_package_list(sorted_results),
+        "source": "libraries.io"
+    }
+
+
+@_log_errors("Failed to get user packages for %s: %s")
+async def _get_user_packages(client: LibrariesIOClient, username: str,
+                             page: int = 1, per_page: int = 100) -> Dict[str, Any]:
+    """Fetch the packages owned by a user."""
+    packages = await client.get_user_packages(username, page, per_page)
+
+    return {
+        "resource_type": "users",
+        "username": username,
+        "page": page,
+        "per_page": per_page,
+        "packages": dump_package_list(packages),
+        "total_count": len(packages),
+        "source": "libraries.io"
+    }
+
+
+@_log_errors("Failed to get organization packages for %s: %s")
+async def _get_organization_packages(client: LibrariesIOClient, org: str,
+                                     page: int = 1, per_page: int = 100) -> Dict[str, Any]:
+    """Fetch the packages owned by an organization."""
+    packages = await client.get_organization_packages(org, page, per_page)
+
+    return {
+        "resource_type": "orgs",
+        "organization": org,
+        "page": page,
+        "per_page": per_page,
+        "packages": dump_package_list(packages),
+        "total_count": len(packages),
+        "source": "libraries.io"
+    }
+
+
+# The four packages:// routes differ only in the literal tail segment, so
+# they are served by one registered template and a dict dispatch on the
+# tail: one route match plus a hash lookup instead of four template
+# matches per request.
+_PKG_DISPATCH = {
+    "info": _get_package_info,
+    "versions": _get_package_versions,
+    "dependencies": _get_package_dependencies,
+    "dependents": _get_package_dependents,
+}
 
 
 def register_resources(server: FastMCP, client: LibrariesIOClient) -> None:
     """
     Register all MCP resources with the server.
-    
+
     Args:
         server: FastMCP server instance
         client: LibrariesIOClient instance
     """
-    
+
     # Platform Resources
-    
+
     @server.resource("platforms://supported")
     async def get_supported_platforms() -> Dict[str, Any]:
         """
         Get list of all supported platforms.
-        
+
         URI: platforms://supported
-        
+
         Returns:
             Dictionary with list of supported platforms
         """
-        try:
-            platforms = await client.get_platforms()
-            return {
-                "resource_type": "platforms",
-                "subtype": "supported",
-                "total_count": len(platforms),
-                "platforms": [platform.model_dump() for platform in platforms],
-                "source": "libraries.io"
-            }
-        except Exception as e:
-            logging.error(f"Failed to get supported platforms: {e}")
-            raise
-    
+        return await _get_supported_platforms(client)
+
     @server.resource("platforms://{platform}/stats")
     async def get_platform_stats(platform: str) -> Dict[str, Any]:
         """
         Get platform-specific statistics.
-        
+
         URI: platforms://{platform}/stats
-        
+
         Args:
             platform: Platform name (extracted from URI)
-            
+
         Returns:
             Platform statistics dictionary
         """
-        try:
-            if not validate_platform(platform):
-                raise ValueError(f"Invalid platform: {platform}")
-            
-            # Use the platform stats endpoint from client
-            stats_data = await client._make_request("GET", f"platform/{platform}")
-            
-            return {
-                "resource_type": "platforms",
-                "platform": platform,
-                "statistics": stats_data,
-                "source": "libraries.io"
-            }
-        except Exception as e:
-            logging.error(f"Failed to get platform stats for {platform}: {e}")
-            raise
-    
+        return await _get_platform_stats(client, platform)
+
     # Package Resources
-    
-    @server.resource("packages://{platform}/{name}/info")
-    async def get_package_info(platform: str, name: str) -> Dict[str, Any]:
-        """
-        Get comprehensive package information.
-        
-        URI: packages://{platform}/{name}/info
-        
-        Args:
-            platform: Package manager platform (extracted from URI)
-            name: Package name (extracted from URI)
-            
-        Returns:
-            Package information dictionary
-        """
-        try:
-            if not validate_platform(platform):
-                raise ValueError(f"Invalid platform: {platform}")
-            
-            name = sanitize_package_name(name)
-            package = await client.get_package(platform, name, include_versions=True)
-            
-            return {
-                "resource_type": "packages",
-                "platform": platform,
-                "name": name,
-                "package": package.model_dump(),
-                "source": "libraries.io"
-            }
-        except Exception as e:
-            logging.error(f"Failed to get package info for {platform}/{name}: {e}")
-            raise
-    
-    @server.resource("packages://{platform}/{name}/versions")
-    async def get_package_versions(platform: str, name: str) -> Dict[str, Any]:
-        """
-        Get package version history.
-        
-        URI: packages://{platform}/{name}/versions
-        
-        Args:
-            platform: Package manager platform (extracted from URI)
-            name: Package name (extracted from URI)
-            
-        Returns:
-            Package versions dictionary
-        """
-        try:
-            if not validate_platform(platform):
-                raise ValueError(f"Invalid platform: {platform}")
-            
-            name = sanitize_package_name(name)
-            versions = await client.get_package_versions(platform, name)
-            
-            return {
-                "resource_type": "packages",
-                "platform": platform,
-                "name": name,
-                "versions": [version.model_dump() for version in versions],
-                "total_count": len(versions),
-                "source": "libraries.io"
-            }
-        except Exception as e:
-            logging.error(f"Failed to get package versions for {platform}/{name}: {e}")
-            raise
-    
-    @server.resource("packages://{platform}/{name}/dependencies")
-    async def get_package_dependencies(platform: str, name: str, version: Optional[str] = None) -> Dict[str, Any]:
-        """
-        Get package dependencies.
-        
-        URI: packages://{platform}/{name}/dependencies[?version={version}]
-        
-        Args:
-            platform: Package manager platform (extracted from URI)
-            name: Package name (extracted from URI)
-            version: Specific version (optional, from query params)
-            
-        Returns:
-            Package dependencies dictionary
-        """
-        try:
-            if not validate_platform(platform):
-                raise ValueError(f"Invalid platform: {platform}")
-            
-            name = sanitize_package_name(name)
-            dependencies = await client.get_package_dependencies(platform, name, version)
-            
-            return {
-                "resource_type": "packages",
-                "platform": platform,
-                "name": name,
-                "version": version,
-                "dependencies": [dep.model_dump() for dep in dependencies],
-                "total_count": len(dependencies),
-                "source": "libraries.io"
-            }
-        except Exception as e:
-            logging.error(f"Failed to get package dependencies for {platform}/{name}: {e}")
-            raise
-    
-    @server.resource("packages://{platform}/{name}/dependents")
-    async def get_package_dependents(platform: str, name: str, page: int = 1, per_page: int = 100) -> Dict[str, Any]:
+
+    @server.resource("packages://{platform}/{name}/{kind}")
+    async def get_package_resource(platform: str, name: str, kind: str,
+                                   version: Optional[str] = None,
+                                   page: int = 1, per_page: int = 100) -> Dict[str, Any]:
         """
-        Get packages that depend on this package.
-        
-        URI: packages://{platform}/{name}/dependents[?page={page}&per_page={per_page}]
-        
+        Get package data: info, versions, dependencies, or dependents.
+
+        URI: packages://{platform}/{name}/{kind}[?version={version}&page={page}&per_page={per_page}]
+
         Args:
             platform: Package manager platform (extracted from URI)
             name: Package name (extracted from URI)
-            page: Page number (optional, from query params, default: 1)
-            per_page: Items per page (optional, from query params, default: 100, max: 100)
-            
+            kind: One of "info", "versions", "dependencies", "dependents"
+                (extracted from URI)
+            version: Specific version (optional, from query params,
+                "dependencies" only)
+            page: Page number (optional, from query params, "dependents"
+                only, default: 1)
+            per_page: Items per page (optional, from query params,
+                "dependents" only, default: 100, max: 100)
+
         Returns:
-            Package dependents dictionary
+            Package data dictionary for the requested kind
         """
-        try:
-            if not validate_platform(platform):
-                raise ValueError(f"Invalid platform: {platform}")
-            
-            name = sanitize_package_name(name)
-            dependents = await client.get_package_dependents(platform, name, page, per_page)
-            
-            return {
-                "resource_type": "packages",
-                "platform": platform,
-                "name": name,
-                "page": page,
-                "per_page": per_page,
-                "dependents": [pkg.model_dump() for pkg in dependents],
-                "total_count": len(dependents),
-                "source": "libraries.io"
-            }
-        except Exception as e:
-            logging.error(f"Failed to get package dependents for {platform}/{name}: {e}")
-            raise
-    
+        handler = _PKG_DISPATCH.get(kind)
+        if handler is None:
+            raise ValueError(f"Unknown package resource: {kind}")
+        if kind == "dependencies":
+            return await handler(client, platform, name, version)
+        if kind == "dependents":
+            return await handler(client, platform, name, page, per_page)
+        return await handler(client, platform, name)
+
     # Search Resources
-    
+
     @server.resource("search://packages")
     async def search_packages(query: str, platforms: Optional[str] = None,
                               languages: Optional[str] = None, licenses: Optional[str] = None,
                               page: int = 1, per_page: int = 10) -> Dict[str, Any]:
         """
         Search for packages.
-        
+
         URI: search://packages[?q={query}&platforms={platforms}&languages={languages}&licenses={licenses}&page={page}&per_page={per_page}]
-        
+
         Args:
             query: Search query (required, from query params)
             platforms: Filter by platforms (optional, from query params)
@@ -323,179 +558,65 @@ def register_resources(server: FastMCP, client: LibrariesIOClient) -> None:
             licenses: Filter by licenses (optional, from query params)
             page: Page number (optional, from query params, default: 1)
             per_page: Items per page (optional, from query params, default: 10, max: 100)
-            
+
         Returns:
             Search results dictionary
         """
-        try:
-            if not query:
-                raise ValueError("Query parameter 'q' is required")
-            
-            # Parse comma-separated values
-            platform_list = platforms.split(',') if platforms else None
-            language_list = languages.split(',') if languages else None
-            license_list = licenses.split(',') if licenses else None
-            
-            search_result = await client.search_packages(
-                query=query,
-                platforms=platform_list,
-                languages=language_list,
-                licenses=license_list,
-                page=page,
-                per_page=min(per_page, 100)
-            )
-            
-            return {
-                "resource_type": "search",
-                "search_type": "packages",
-                "query": query,
-                "platforms": platform_list,
-                "languages": language_list,
-                "licenses": license_list,
-                "page": page,
-                "per_page": per_page,
-                "total_count": search_result.total_count,
-                "incomplete_results": search_result.incomplete_results,
-                "items": [pkg.model_dump() for pkg in search_result.items],
-                "source": "libraries.io"
-            }
-        except Exception as e:
-            logging.error(f"Failed to search packages with query '{query}': {e}")
-            raise
-    
+        return await _search_packages(client, query, platforms, languages,
+                                      licenses, page, per_page)
+
     @server.resource("search://trending")
     async def get_trending_packages(platform: Optional[str] = None,
                                    period: str = "weekly") -> Dict[str, Any]:
         """
         Get trending packages.
-        
+
         URI: search://trending[?platform={platform}&period={period}]
-        
+
         Args:
             platform: Filter by platform (optional, from query params)
             period: Time period (optional, from query params, default: "weekly")
-            
+
         Returns:
             Trending packages dictionary
         """
-        try:
-            # Note: Libraries.io doesn't have a direct trending endpoint,
-            # so we'll use search with popular keywords as a workaround
-            trending_queries = {
-                "weekly": ["popular", "trending", "hot"],
-                "monthly": ["popular", "trending", "rising"],
-                "daily": ["trending", "new", "hot"]
-            }
-            
-            queries = trending_queries.get(period.lower(), ["popular", "trending"])
-            
-            # Search for popular packages
-            all_results = []
-            for query in queries[:3]:  # Limit to 3 queries to avoid rate limiting
-                if platform:
-                    search_result = await client.search_packages(
-                        query=query,
-                        platforms=[platform] if platform else None,
-                        page=1,
-                        per_page=min(20, 100 // len(queries))
-                    )
-                else:
-                    search_result = await client.search_packages(
-                        query=query,
-                        page=1,
-                        per_page=min(20, 100 // len(queries))
-                    )
-                all_results.extend(search_result.items)
-            
-            # Remove duplicates and sort by stars
-            unique_results = {}
-            for pkg in all_results:
-                key = (pkg.platform, pkg.name)
-                if key not in unique_results or (pkg.stars or 0) > (unique_results[key].stars or 0):
-                    unique_results[key] = pkg
-            
-            sorted_results = sorted(
-                unique_results.values(),
-                key=lambda x: (x.stars or 0),
-                reverse=True
-            )[:50]  # Limit to top 50
-            
-            return {
-                "resource_type": "search",
-                "search_type": "trending",
-                "platform": platform,
-                "period": period,
-                "total_count": len(sorted_results),
-                "items": [pkg.model_dump() for pkg in sorted_results],
-                "source": "libraries.io"
-            }
-        except Exception as e:
-            logging.error(f"Failed to get trending packages: {e}")
-            raise
-    
+        return await _get_trending_packages(client, platform, period)
+
     # User/Organization Resources
-    
+
     @server.resource("users://{username}/packages")
     async def get_user_packages(username: str, page: int = 1, per_page: int = 100) -> Dict[str, Any]:
         """
         Get user's packages.
-        
+
         URI: users://{username}/packages[?page={page}&per_page={per_page}]
-        
+
         Args:
             username: GitHub username (extracted from URI)
             page: Page number (optional, from query params, default: 1)
             per_page: Items per page (optional, from query params, default: 100, max: 100)
-            
+
         Returns:
             User packages dictionary
         """
-        try:
-            packages = await client.get_user_packages(username, page, per_page)
-            
-            return {
-                "resource_type": "users",
-                "username": username,
-                "page": page,
-                "per_page": per_page,
-                "packages": [pkg.model_dump() for pkg in packages],
-                "total_count": len(packages),
-                "source": "libraries.io"
-            }
-        except Exception as e:
-            logging.error(f"Failed to get user packages for {username}: {e}")
-            raise
-    
+        return await _get_user_packages(client, username, page, per_page)
+
     @server.resource("orgs://{org}/packages")
     async def get_organization_packages(org: str, page: int = 1, per_page: int = 100) -> Dict[str, Any]:
         """
         Get organization's packages.
-        
+
         URI: orgs://{org}/packages[?page={page}&per_page={per_page}]
-        
+
         Args:
             org: GitHub organization name (extracted from URI)
             page: Page number (optional, from query params, default: 1)
             per_page: Items per page (optional, from query params, default: 100, max: 100)
-            
+
         Returns:
             Organization packages dictionary
         """
-        try:
-            packages = await client.get_organization_packages(org, page, per_page)
-            
-            return {
-                "resource_type": "orgs",
-                "organization": org,
-                "page": page,
-                "per_page": per_page,
-                "packages": [pkg.model_dump() for pkg in packages],
-                "total_count": len(packages),
-                "source": "libraries.io"
-            }
-        except Exception as e:
-            logging.error(f"Failed to get organization packages for {org}: {e}")
-            raise
-
-
-__all__ = ["register_resources", "parse_resource_uri"]
\ No newline at end of file
+        return await _get_organization_packages(client, org, page, per_page)
+
+
+__all__ = ["register_resources", "parse_resource_uri", "ParsedURI"]
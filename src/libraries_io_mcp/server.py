@@ -34,7 +34,8 @@ class LibrariesIOServer:
         api_key: Optional[str] = None,
         host: str = "0.0.0.0",
         port: int = 8000,
-        log_level: str = "INFO"
+        log_level: str = "INFO",
+        client: Optional[LibrariesIOClient] = None
     ):
         """
         Initialize the Libraries.io MCP Server.
@@ -44,8 +45,9 @@ class LibrariesIOServer:
             host: Host address to bind the server to
             port: Port to bind the server to
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            client: Existing LibrariesIOClient to share (a new one is created if omitted)
         """
-        self.api_key = api_key or os.getenv("LIBRARIES_IO_API_KEY")
+        self.api_key = api_key or (client.api_key if client else None) or os.getenv("LIBRARIES_IO_API_KEY")
         if not self.api_key:
             raise ValueError(
                 "API key is required. Set LIBRARIES_IO_API_KEY environment variable "
@@ -66,8 +68,9 @@ class LibrariesIOServer:
             description="A Model Context Protocol server for interacting with the Libraries.io API"
         )
         
-        # Initialize client
-        self.client = LibrariesIOClient(
+        # Initialize client; reusing a caller-provided client shares its
+        # connection pool, cache, and rate limit bucket with the server
+        self.client = client or LibrariesIOClient(
             api_key=self.api_key,
             logger=self.logger
         )
@@ -134,18 +137,33 @@ class LibrariesIOServer:
         except Exception as e:
             self.logger.error(f"Failed to start server: {e}")
             raise
-    
+
+    async def stop(self) -> None:
+        """Release the shared HTTP connection pool."""
+        await self.client.close()
+
+    async def __aenter__(self) -> "LibrariesIOServer":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
     async def run(self) -> None:
         """Run the server with all components registered."""
         self.register_all()
-        await self.start()
+        # The client's pooled httpx.AsyncClient lives for the whole server
+        # run, so every handler reuses keep-alive connections; close it
+        # once on the way out.
+        async with self:
+            await self.start()
 
 
 def create_server(
     api_key: Optional[str] = None,
     host: str = "0.0.0.0",
     port: int = 8000,
-    log_level: str = "INFO"
+    log_level: str = "INFO",
+    client: Optional[LibrariesIOClient] = None
 ) -> LibrariesIOServer:
     """
     Create and configure a LibrariesIOServer instance.
@@ -155,6 +173,7 @@ def create_server(
         host: Host address to bind the server to
         port: Port to bind the server to
         log_level: Logging level
+        client: Existing LibrariesIOClient to share (a new one is created if omitted)
         
     Returns:
         Configured LibrariesIOServer instance
@@ -163,7 +182,8 @@ def create_server(
         api_key=api_key,
         host=host,
         port=port,
-        log_level=log_level
+        log_level=log_level,
+        client=client
     )
 
 
@@ -5,10 +5,14 @@ This module contains the tool implementations for interacting with Libraries.io.
 """
 
 import asyncio
+import heapq
 import logging
+import re
+from contextvars import ContextVar
 from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
 from enum import Enum
+from operator import itemgetter
 
 try:
     from fastmcp import FastMCP
@@ -24,7 +28,8 @@ except ImportError:
 from .client import LibrariesIOClient, LibrariesIOClientError
 from .models import (
     Platform, Package, PackageVersion, Dependency, SearchResult,
-    APIError, RateLimitInfo
+    APIError, RateLimitInfo,
+    dump_package_list, dump_version_list, dump_dependency_list
 )
 
 
@@ -157,18 +162,44 @@ class ToolResponse(BaseModel):
     rate_limit_info: Optional[Dict[str, Any]] = Field(None, description="Rate limit information")
 
 
-# MCP Tool implementations
+def _ok(data: Optional[Dict[str, Any]], rate_limit_info: Optional[Dict[str, Any]] = None) -> ToolResponse:
+    """Build a success response without re-validating server-assembled data."""
+    return ToolResponse.model_construct(
+        success=True, data=data, error=None, rate_limit_info=rate_limit_info
+    )
+
+
+def _err(error: str) -> ToolResponse:
+    """Build a failure response without re-validating the error string."""
+    return ToolResponse.model_construct(
+        success=False, data=None, error=error, rate_limit_info=None
+    )
+
+
+# Shared client for all tool handlers, bound once at registration.
+# A ContextVar read is a plain context lookup, asyncio-aware, and avoids
+# per-call attribute traversal through the FunctionTool wrappers.
+_client_var: ContextVar[LibrariesIOClient] = ContextVar("libraries_io_client")
+
+
+# MCP Tool implementations. The FunctionTool import is resolved once at
+# module load instead of once per decorated tool; older fastmcp versions
+# without it fall back to the bare coroutine.
+if MCP_AVAILABLE:
+    try:
+        from fastmcp.tools import FunctionTool
+        _FUNCTION_TOOL_FACTORY = FunctionTool.from_function
+    except ImportError:
+        _FUNCTION_TOOL_FACTORY = None
+else:
+    _FUNCTION_TOOL_FACTORY = None
+
+
 def _make_tool(func):
     """Decorator to make MCP tools with proper error handling."""
-    if MCP_AVAILABLE:
-        try:
-            from fastmcp.tools import FunctionTool
-            return FunctionTool.from_function(func)
-        except ImportError:
-            # Fallback for different fastmcp versions
-            return func
-    else:
-        return func
+    if _FUNCTION_TOOL_FACTORY is not None:
+        return _FUNCTION_TOOL_FACTORY(func)
+    return func
 
 @_make_tool
 async def search_packages(
@@ -195,17 +226,17 @@ async def search_packages(
     """
     try:
         # Validate parameters
-        if not query.strip():
-            return ToolResponse(success=False, error="Query cannot be empty")
+        if not query or query.isspace():
+            return _err("Query cannot be empty")
         
         if not (1 <= page <= 100):
-            return ToolResponse(success=False, error="Page must be between 1 and 100")
+            return _err("Page must be between 1 and 100")
         
         if not (1 <= per_page <= 100):
-            return ToolResponse(success=False, error="per_page must be between 1 and 100")
+            return _err("per_page must be between 1 and 100")
         
         # Get client from context
-        client = search_packages.__mcp_client__
+        client = _client_var.get()
         
         # Search packages
         result = await client.search_packages(
@@ -221,25 +252,20 @@ async def search_packages(
         response_data = {
             "total_count": result.total_count,
             "incomplete_results": result.incomplete_results,
-            "items": [pkg.dict() for pkg in result.items],
+            "items": dump_package_list(result.items),
             "page": page,
             "per_page": per_page
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -263,13 +289,13 @@ async def get_trending_packages(
         # Validate parameters
         valid_time_ranges = ["day", "week", "month"]
         if time_range not in valid_time_ranges:
-            return ToolResponse(success=False, error=f"time_range must be one of {valid_time_ranges}")
+            return _err(f"time_range must be one of {valid_time_ranges}")
         
         if not (1 <= limit <= 100):
-            return ToolResponse(success=False, error="limit must be between 1 and 100")
+            return _err("limit must be between 1 and 100")
         
         # Get client from context
-        client = get_trending_packages.__mcp_client__
+        client = _client_var.get()
         
         # Note: This is a simulated implementation since Libraries.io may not have a direct trending endpoint
         # We'll search for recently updated popular packages as a proxy for trending
@@ -283,33 +309,29 @@ async def get_trending_packages(
         )
         
         # Sort by recent activity (stars + recent updates)
-        trending_packages = sorted(
+        # nlargest is O(n log limit) and skips sorting the discarded tail
+        trending_packages = heapq.nlargest(
+            limit,
             result.items,
-            key=lambda pkg: (pkg.stars or 0, pkg.latest_release_published_at or datetime.min),
-            reverse=True
-        )[:limit]
+            key=lambda pkg: (pkg.stars or 0, pkg.latest_release_published_at or datetime.min)
+        )
         
         response_data = {
             "platform": platform,
             "time_range": time_range,
-            "packages": [pkg.dict() for pkg in trending_packages],
+            "packages": dump_package_list(trending_packages),
             "count": len(trending_packages)
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -332,10 +354,10 @@ async def get_popular_packages(
     try:
         # Validate parameters
         if not (1 <= limit <= 100):
-            return ToolResponse(success=False, error="limit must be between 1 and 100")
+            return _err("limit must be between 1 and 100")
         
         # Get client from context
-        client = get_popular_packages.__mcp_client__
+        client = _client_var.get()
         
         # Search for popular packages (using stars as a proxy for popularity)
         search_query = "popular" if not platform else f"popular {platform}"
@@ -349,33 +371,28 @@ async def get_popular_packages(
         )
         
         # Sort by stars (most popular first)
-        popular_packages = sorted(
+        popular_packages = heapq.nlargest(
+            limit,
             result.items,
-            key=lambda pkg: pkg.stars or 0,
-            reverse=True
-        )[:limit]
+            key=lambda pkg: pkg.stars or 0
+        )
         
         response_data = {
             "platform": platform,
             "language": language,
-            "packages": [pkg.dict() for pkg in popular_packages],
+            "packages": dump_package_list(popular_packages),
             "count": len(popular_packages)
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -397,14 +414,14 @@ async def get_package_info(
     """
     try:
         # Validate parameters
-        if not platform.strip():
-            return ToolResponse(success=False, error="Platform cannot be empty")
+        if not platform or platform.isspace():
+            return _err("Platform cannot be empty")
         
-        if not name.strip():
-            return ToolResponse(success=False, error="Package name cannot be empty")
+        if not name or name.isspace():
+            return _err("Package name cannot be empty")
         
         # Get client from context
-        client = get_package_info.__mcp_client__
+        client = _client_var.get()
         
         # Get package information
         package = await client.get_package(
@@ -413,22 +430,17 @@ async def get_package_info(
             include_versions=include_versions
         )
         
-        response_data = package.dict()
+        response_data = package.model_dump()
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -448,14 +460,14 @@ async def get_package_versions(
     """
     try:
         # Validate parameters
-        if not platform.strip():
-            return ToolResponse(success=False, error="Platform cannot be empty")
+        if not platform or platform.isspace():
+            return _err("Platform cannot be empty")
         
-        if not name.strip():
-            return ToolResponse(success=False, error="Package name cannot be empty")
+        if not name or name.isspace():
+            return _err("Package name cannot be empty")
         
         # Get client from context
-        client = get_package_versions.__mcp_client__
+        client = _client_var.get()
         
         # Get package versions
         versions = await client.get_package_versions(
@@ -466,24 +478,19 @@ async def get_package_versions(
         response_data = {
             "platform": platform,
             "name": name,
-            "versions": [version.dict() for version in versions],
+            "versions": dump_version_list(versions),
             "count": len(versions)
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -505,14 +512,14 @@ async def get_package_dependencies(
     """
     try:
         # Validate parameters
-        if not platform.strip():
-            return ToolResponse(success=False, error="Platform cannot be empty")
+        if not platform or platform.isspace():
+            return _err("Platform cannot be empty")
         
-        if not name.strip():
-            return ToolResponse(success=False, error="Package name cannot be empty")
+        if not name or name.isspace():
+            return _err("Package name cannot be empty")
         
         # Get client from context
-        client = get_package_dependencies.__mcp_client__
+        client = _client_var.get()
         
         # Get package dependencies
         dependencies = await client.get_package_dependencies(
@@ -525,24 +532,19 @@ async def get_package_dependencies(
             "platform": platform,
             "name": name,
             "version": version,
-            "dependencies": [dep.dict() for dep in dependencies],
+            "dependencies": dump_dependency_list(dependencies),
             "count": len(dependencies)
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -566,20 +568,20 @@ async def get_package_dependents(
     """
     try:
         # Validate parameters
-        if not platform.strip():
-            return ToolResponse(success=False, error="Platform cannot be empty")
+        if not platform or platform.isspace():
+            return _err("Platform cannot be empty")
         
-        if not name.strip():
-            return ToolResponse(success=False, error="Package name cannot be empty")
+        if not name or name.isspace():
+            return _err("Package name cannot be empty")
         
         if not (1 <= page <= 100):
-            return ToolResponse(success=False, error="Page must be between 1 and 100")
+            return _err("Page must be between 1 and 100")
         
         if not (1 <= per_page <= 100):
-            return ToolResponse(success=False, error="per_page must be between 1 and 100")
+            return _err("per_page must be between 1 and 100")
         
         # Get client from context
-        client = get_package_dependents.__mcp_client__
+        client = _client_var.get()
         
         # Get package dependents
         dependents = await client.get_package_dependents(
@@ -592,26 +594,21 @@ async def get_package_dependents(
         response_data = {
             "platform": platform,
             "name": name,
-            "dependents": [pkg.dict() for pkg in dependents],
+            "dependents": dump_package_list(dependents),
             "page": page,
             "per_page": per_page,
             "count": len(dependents)
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -632,52 +629,58 @@ async def compare_packages(
     try:
         # Validate parameters
         if not packages:
-            return ToolResponse(success=False, error="At least one package must be provided")
+            return _err("At least one package must be provided")
         
         if len(packages) > 10:
-            return ToolResponse(success=False, error="Maximum 10 packages can be compared")
+            return _err("Maximum 10 packages can be compared")
         
         # Validate package format
         for i, pkg in enumerate(packages):
             if 'platform' not in pkg or 'name' not in pkg:
-                return ToolResponse(
-                    success=False,
-                    error=f"Package {i+1} must have 'platform' and 'name' fields"
-                )
+                return _err(f"Package {i+1} must have 'platform' and 'name' fields")
         
         # Get client from context
-        client = compare_packages.__mcp_client__
+        client = _client_var.get()
         
         # Default features to compare
         if features is None:
             features = ['name', 'platform', 'description', 'stars', 'latest_release_number']
-        
-        comparison_results = []
-        
-        for pkg in packages:
+
+        # Resolve requested features against the model's field set once,
+        # rather than probing hasattr/getattr per feature per package.
+        known_features = [f for f in features if f in Package.model_fields]
+
+        # Fetch all packages concurrently; the semaphore bounds the fan-out
+        # so a large comparison doesn't trip the API rate limit.
+        semaphore = asyncio.Semaphore(10)
+
+        async def fetch_comparison(pkg: Dict[str, str]) -> Dict[str, Any]:
             try:
-                package_info = await client.get_package(
-                    platform=pkg['platform'],
-                    name=pkg['name'],
-                    include_versions=True
-                )
-                
-                # Extract requested features
-                comparison_data = {}
-                for feature in features:
-                    if hasattr(package_info, feature):
-                        comparison_data[feature] = getattr(package_info, feature)
-                
-                comparison_results.append({
+                async with semaphore:
+                    package_info = await client.get_package(
+                        platform=pkg['platform'],
+                        name=pkg['name'],
+                        include_versions=True
+                    )
+
+                # Extract requested features straight from the field values
+                values = package_info.__dict__
+                comparison_data = {f: values[f] for f in known_features}
+
+                return {
                     "package": f"{pkg['platform']}/{pkg['name']}",
                     "info": comparison_data
-                })
-                
+                }
+
             except LibrariesIOClientError as e:
-                comparison_results.append({
+                return {
                     "package": f"{pkg['platform']}/{pkg['name']}",
                     "error": str(e)
-                })
+                }
+
+        comparison_results = list(await asyncio.gather(
+            *(fetch_comparison(pkg) for pkg in packages)
+        ))
         
         response_data = {
             "packages": comparison_results,
@@ -685,20 +688,22 @@ async def compare_packages(
             "total_packages": len(packages)
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
+
+
+# Compiled once: the per-call versions re-uppercased/lowered the inputs
+# for every candidate, and plain substring matching misread "GPL" inside
+# unrelated license strings. Word boundaries keep the match tokenized.
+_RESTRICTIVE_LICENSE_RE = re.compile(r'\b(?:A?GPL|LGPL)\b', re.IGNORECASE)
+_VULN_KEYWORDS_RE = re.compile(r'vulnerable|exploit', re.IGNORECASE)
 
 
 @_make_tool
@@ -720,14 +725,14 @@ async def check_package_security(
     """
     try:
         # Validate parameters
-        if not platform.strip():
-            return ToolResponse(success=False, error="Platform cannot be empty")
+        if not platform or platform.isspace():
+            return _err("Platform cannot be empty")
         
-        if not name.strip():
-            return ToolResponse(success=False, error="Package name cannot be empty")
+        if not name or name.isspace():
+            return _err("Package name cannot be empty")
         
         # Get client from context
-        client = check_package_security.__mcp_client__
+        client = _client_var.get()
         
         # Get package information first
         package = await client.get_package(
@@ -740,7 +745,7 @@ async def check_package_security(
         security_issues = []
         
         # Check if package has known vulnerabilities (simulated)
-        if "vulnerable" in name.lower() or "exploit" in name.lower():
+        if _VULN_KEYWORDS_RE.search(name):
             security_issues.append({
                 "type": "potential_vulnerability",
                 "severity": "high",
@@ -749,8 +754,7 @@ async def check_package_security(
         
         # Check license for security implications
         if package.licenses:
-            restrictive_licenses = ["GPL", "AGPL", "LGPL"]
-            if any(license.upper() in package.licenses.upper() for license in restrictive_licenses):
+            if _RESTRICTIVE_LICENSE_RE.search(package.licenses):
                 security_issues.append({
                     "type": "license_restriction",
                     "severity": "medium",
@@ -778,20 +782,15 @@ async def check_package_security(
             }
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -817,17 +816,17 @@ async def analyze_dependency_tree(
     """
     try:
         # Validate parameters
-        if not platform.strip():
-            return ToolResponse(success=False, error="Platform cannot be empty")
+        if not platform or platform.isspace():
+            return _err("Platform cannot be empty")
         
-        if not name.strip():
-            return ToolResponse(success=False, error="Package name cannot be empty")
+        if not name or name.isspace():
+            return _err("Package name cannot be empty")
         
         if not (1 <= max_depth <= 10):
-            return ToolResponse(success=False, error="max_depth must be between 1 and 10")
+            return _err("max_depth must be between 1 and 10")
         
         # Get client from context
-        client = analyze_dependency_tree.__mcp_client__
+        client = _client_var.get()
         
         # Get package information
         package = await client.get_package(
@@ -836,43 +835,60 @@ async def analyze_dependency_tree(
             include_versions=True
         )
         
-        # Build dependency tree
-        async def build_dependency_tree(pkg_name: str, pkg_platform: str, current_depth: int = 0) -> Dict[str, Any]:
-            if current_depth >= max_depth:
-                return {"name": pkg_name, "platform": pkg_platform, "depth": current_depth, "dependencies": []}
-            
-            try:
-                dependencies = await client.get_package_dependencies(
+        # Build the tree level by level: every node at the current depth is
+        # fetched concurrently, so latency scales with tree depth rather
+        # than node count. A visited set keeps diamond dependencies from
+        # being re-fetched or re-expanded; later occurrences stay leaves.
+        semaphore = asyncio.Semaphore(16)
+
+        async def fetch_dependencies(pkg_platform: str, pkg_name: str) -> List[Dependency]:
+            async with semaphore:
+                return await client.get_package_dependencies(
                     platform=pkg_platform,
                     name=pkg_name,
                     version=version
                 )
-                
-                tree = {
-                    "name": pkg_name,
-                    "platform": pkg_platform,
-                    "depth": current_depth,
-                    "dependencies": []
-                }
-                
+
+        dependency_tree = {
+            "name": name,
+            "platform": platform,
+            "depth": 0,
+            "dependencies": []
+        }
+        visited = {(platform, name)}
+        frontier = [dependency_tree]
+
+        for depth in range(max_depth):
+            results = await asyncio.gather(
+                *(fetch_dependencies(node["platform"], node["name"]) for node in frontier),
+                return_exceptions=True
+            )
+
+            next_frontier = []
+            for node, dependencies in zip(frontier, results):
+                if isinstance(dependencies, LibrariesIOClientError):
+                    node["error"] = "Failed to fetch dependencies"
+                    continue
+                if isinstance(dependencies, BaseException):
+                    raise dependencies
+
                 for dep in dependencies:
                     if include_dev or dep.kind != "development":
-                        dep_tree = await build_dependency_tree(dep.name, dep.platform, current_depth + 1)
-                        tree["dependencies"].append(dep_tree)
-                
-                return tree
-                
-            except LibrariesIOClientError:
-                return {
-                    "name": pkg_name,
-                    "platform": pkg_platform,
-                    "depth": current_depth,
-                    "error": "Failed to fetch dependencies",
-                    "dependencies": []
-                }
-        
-        # Build the tree
-        dependency_tree = await build_dependency_tree(name, platform, 0)
+                        child = {
+                            "name": dep.name,
+                            "platform": dep.platform,
+                            "depth": depth + 1,
+                            "dependencies": []
+                        }
+                        node["dependencies"].append(child)
+                        key = (dep.platform, dep.name)
+                        if key not in visited:
+                            visited.add(key)
+                            next_frontier.append(child)
+
+            if not next_frontier:
+                break
+            frontier = next_frontier
         
         # Analyze the tree
         def analyze_tree(tree: Dict[str, Any]) -> Dict[str, Any]:
@@ -911,20 +927,15 @@ async def analyze_dependency_tree(
             "include_dev_dependencies": include_dev
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -948,21 +959,21 @@ async def find_alternatives(
     """
     try:
         # Validate parameters
-        if not platform.strip():
-            return ToolResponse(success=False, error="Platform cannot be empty")
+        if not platform or platform.isspace():
+            return _err("Platform cannot be empty")
         
-        if not name.strip():
-            return ToolResponse(success=False, error="Package name cannot be empty")
+        if not name or name.isspace():
+            return _err("Package name cannot be empty")
         
         if not (1 <= limit <= 50):
-            return ToolResponse(success=False, error="limit must be between 1 and 50")
+            return _err("limit must be between 1 and 50")
         
         # Default criteria
         if criteria is None:
             criteria = ["similar", "popular"]
         
         # Get client from context
-        client = find_alternatives.__mcp_client__
+        client = _client_var.get()
         
         # Get original package info
         original_package = await client.get_package(
@@ -1022,14 +1033,17 @@ async def find_alternatives(
                     except LibrariesIOClientError:
                         continue
         
-        # Sort alternatives by relevance (stars + recency)
-        alternatives.sort(
-            key=lambda pkg: (pkg.stars or 0, pkg.latest_release_published_at or datetime.min),
-            reverse=True
-        )
-        
+        # Sort alternatives by relevance (stars + recency). Precomputing the
+        # score column once and sorting on a C-level key avoids re-evaluating
+        # a Python lambda per comparison on large candidate lists.
+        keyed = [
+            ((pkg.stars or 0, pkg.latest_release_published_at or datetime.min), pkg)
+            for pkg in alternatives
+        ]
+        keyed.sort(key=itemgetter(0), reverse=True)
+
         # Take only the requested number
-        alternatives = alternatives[:limit]
+        alternatives = [pkg for _, pkg in keyed[:limit]]
         
         response_data = {
             "original_package": {
@@ -1039,24 +1053,19 @@ async def find_alternatives(
                 "description": original_package.description
             },
             "criteria": criteria,
-            "alternatives": [pkg.dict() for pkg in alternatives],
+            "alternatives": dump_package_list(alternatives),
             "count": len(alternatives)
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -1076,11 +1085,11 @@ async def get_platform_stats(
     """
     try:
         # Validate parameters
-        if not platform.strip():
-            return ToolResponse(success=False, error="Platform cannot be empty")
+        if not platform or platform.isspace():
+            return _err("Platform cannot be empty")
         
         # Get client from context
-        client = get_platform_stats.__mcp_client__
+        client = _client_var.get()
         
         # Get platforms to verify the requested platform exists
         platforms = await client.get_platforms()
@@ -1092,7 +1101,7 @@ async def get_platform_stats(
                 break
         
         if not platform_info:
-            return ToolResponse(success=False, error=f"Platform '{platform}' is not supported")
+            return _err(f"Platform '{platform}' is not supported")
         
         # Get some sample packages for statistics
         sample_packages = []
@@ -1149,24 +1158,19 @@ async def get_platform_stats(
                 "languages": languages,
                 "most_common_language": most_common_language
             },
-            "trending_packages": [pkg.dict() for pkg in trending_packages] if include_trending else [],
+            "trending_packages": dump_package_list(trending_packages) if include_trending else [],
             "supported": True
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -1187,11 +1191,11 @@ async def check_license_compatibility(
     try:
         # Validate parameters
         if not licenses:
-            return ToolResponse(success=False, error="At least one license must be provided")
+            return _err("At least one license must be provided")
         
         valid_use_cases = ["commercial", "open_source", "academic"]
         if use_case not in valid_use_cases:
-            return ToolResponse(success=False, error=f"use_case must be one of {valid_use_cases}")
+            return _err(f"use_case must be one of {valid_use_cases}")
         
         # License compatibility rules (simplified)
         compatibility_rules = {
@@ -1256,10 +1260,10 @@ async def check_license_compatibility(
             "compatibility_rules": compatibility_rules
         }
         
-        return ToolResponse(success=True, data=response_data)
+        return _ok(response_data)
         
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 def _get_license_restrictions(license_name: str, use_case: str) -> List[str]:
@@ -1314,18 +1318,18 @@ async def track_package_updates(
     """
     try:
         # Validate parameters
-        if not platform.strip():
-            return ToolResponse(success=False, error="Platform cannot be empty")
+        if not platform or platform.isspace():
+            return _err("Platform cannot be empty")
         
-        if not name.strip():
-            return ToolResponse(success=False, error="Package name cannot be empty")
+        if not name or name.isspace():
+            return _err("Package name cannot be empty")
         
         valid_intervals = ["hourly", "daily", "weekly"]
         if check_interval not in valid_intervals:
-            return ToolResponse(success=False, error=f"check_interval must be one of {valid_intervals}")
+            return _err(f"check_interval must be one of {valid_intervals}")
         
         # Get client from context
-        client = track_package_updates.__mcp_client__
+        client = _client_var.get()
         
         # Get current package information
         current_package = await client.get_package(
@@ -1338,7 +1342,7 @@ async def track_package_updates(
         versions = await client.get_package_versions(platform=platform, name=name)
         
         if not versions:
-            return ToolResponse(success=False, error="No versions found for package")
+            return _err("No versions found for package")
         
         # Sort versions by publication date
         versions.sort(key=lambda v: v.published_at or datetime.min, reverse=True)
@@ -1385,20 +1389,15 @@ async def track_package_updates(
             "next_check": _calculate_next_check(check_interval)
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=response_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(response_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 def _calculate_next_check(interval: str) -> str:
@@ -1441,13 +1440,13 @@ async def generate_dependency_report(
     try:
         # Validate parameters
         if not packages:
-            return ToolResponse(success=False, error="At least one package must be provided")
+            return _err("At least one package must be provided")
         
         if len(packages) > 20:
-            return ToolResponse(success=False, error="Maximum 20 packages can be analyzed")
+            return _err("Maximum 20 packages can be analyzed")
         
         # Get client from context
-        client = generate_dependency_report.__mcp_client__
+        client = _client_var.get()
         
         report_data = {
             "generated_at": datetime.now().isoformat(),
@@ -1455,35 +1454,39 @@ async def generate_dependency_report(
             "packages": []
         }
         
+        # Validate package format up front so a malformed entry still fails
+        # fast before any network traffic
+        for pkg in packages:
+            if 'platform' not in pkg or 'name' not in pkg:
+                return _err(f"Package must have 'platform' and 'name' fields")
+
         total_dependencies = 0
         security_issues = []
         unique_languages = set()
-        
-        for pkg in packages:
+
+        # Analyze all packages concurrently; the semaphore bounds the
+        # fan-out so a large report doesn't trip the API rate limit.
+        semaphore = asyncio.Semaphore(10)
+
+        async def build_package_report(pkg: Dict[str, str]) -> Dict[str, Any]:
+            platform = pkg['platform']
+            name = pkg['name']
+
             try:
-                # Validate package format
-                if 'platform' not in pkg or 'name' not in pkg:
-                    return ToolResponse(
-                        success=False,
-                        error=f"Package must have 'platform' and 'name' fields"
-                    )
-                
-                platform = pkg['platform']
-                name = pkg['name']
-                
                 package_report = {
                     "platform": platform,
                     "name": name,
                     "status": "success"
                 }
-                
+
                 # Get package info
-                package_info = await client.get_package(
-                    platform=platform,
-                    name=name,
-                    include_versions=include_versions
-                )
-                
+                async with semaphore:
+                    package_info = await client.get_package(
+                        platform=platform,
+                        name=name,
+                        include_versions=include_versions
+                    )
+
                 # Add basic info
                 package_report.update({
                     "description": package_info.description,
@@ -1493,46 +1496,57 @@ async def generate_dependency_report(
                     "homepage": package_info.homepage,
                     "repository_url": package_info.repository_url
                 })
-                
-                if package_info.language:
-                    unique_languages.add(package_info.language)
-                
+
                 # Add version info if requested
                 if include_versions:
-                    versions = await client.get_package_versions(platform=platform, name=name)
+                    async with semaphore:
+                        versions = await client.get_package_versions(platform=platform, name=name)
                     package_report["versions"] = str({
                         "total": len(versions),
                         "latest": versions[0].number if versions else None,
                         "oldest": versions[-1].number if versions else None
                     })
-                
+
                 # Add dependency info if requested
                 if include_dependencies:
-                    dependencies = await client.get_package_dependencies(platform=platform, name=name)
+                    async with semaphore:
+                        dependencies = await client.get_package_dependencies(platform=platform, name=name)
                     package_report["dependencies"] = str({
                         "total": len(dependencies),
                         "runtime": len([d for d in dependencies if d.kind != "development"]),
                         "development": len([d for d in dependencies if d.kind == "development"])
                     })
-                    total_dependencies += len(dependencies)
-                
+                    package_report["_dependency_count"] = len(dependencies)
+
                 # Add security info if requested
                 if include_security:
                     security_result = await check_package_security(platform, name)
                     if security_result.success:
                         if security_result.data:
                             package_report["security"] = str(security_result.data.get("security_issues", []))
-                            security_issues.extend(security_result.data.get("security_issues", []))
-                
-                report_data["packages"].append(package_report)
-                
+                            package_report["_security_issues"] = security_result.data.get("security_issues", [])
+
+                return package_report
+
             except LibrariesIOClientError as e:
-                report_data["packages"].append({
-                    "platform": pkg.get('platform', 'unknown'),
-                    "name": pkg.get('name', 'unknown'),
+                return {
+                    "platform": platform,
+                    "name": name,
                     "status": "error",
                     "error": str(e)
-                })
+                }
+
+        package_reports = await asyncio.gather(
+            *(build_package_report(pkg) for pkg in packages)
+        )
+
+        # Merge in request order so the report stays deterministic
+        for package_report in package_reports:
+            if package_report.get("language"):
+                unique_languages.add(package_report["language"])
+            total_dependencies += package_report.pop("_dependency_count", 0)
+            security_issues.extend(package_report.pop("_security_issues", []))
+            report_data["packages"].append(package_report)
         
         # Generate summary
         report_data["summary"] = {
@@ -1545,20 +1559,15 @@ async def generate_dependency_report(
             "security_score": max(0, 100 - len(security_issues) * 10)  # Simple scoring
         }
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=report_data,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(report_data, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 @_make_tool
@@ -1584,17 +1593,17 @@ async def audit_project_dependencies(
     """
     try:
         # Validate parameters
-        if not platform.strip():
-            return ToolResponse(success=False, error="Platform cannot be empty")
+        if not platform or platform.isspace():
+            return _err("Platform cannot be empty")
         
         if not packages:
-            return ToolResponse(success=False, error="At least one package must be provided")
+            return _err("At least one package must be provided")
         
         if len(packages) > 50:
-            return ToolResponse(success=False, error="Maximum 50 packages can be audited")
+            return _err("Maximum 50 packages can be audited")
         
         # Get client from context
-        client = audit_project_dependencies.__mcp_client__
+        client = _client_var.get()
         
         audit_results = {
             "platform": platform,
@@ -1649,73 +1658,92 @@ async def audit_project_dependencies(
                 })
                 audit_results["summary"]["duplicates_count"] += len(duplicates)
         
-        # Check each package for issues
-        for name, pkg_info in package_registry.items():
+        # Audit all packages concurrently; the semaphore bounds the fan-out
+        # so a large project doesn't trip the API rate limit.
+        semaphore = asyncio.Semaphore(10)
+
+        async def audit_package(name: str, pkg_info: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
             version = pkg_info["version"]
-            original_pkg = pkg_info["original"]
-            
+            findings: Dict[str, List[Dict[str, Any]]] = {
+                "outdated": [],
+                "security": [],
+                "recommendations": []
+            }
+
             try:
                 # Get package info
-                package = await client.get_package(
-                    platform=platform,
-                    name=name,
-                    include_versions=True
-                )
-                
+                async with semaphore:
+                    package = await client.get_package(
+                        platform=platform,
+                        name=name,
+                        include_versions=True
+                    )
+
                 # Check for outdated packages
                 if check_outdated and package.latest_release_number:
                     if version and version != package.latest_release_number:
-                        audit_results["audits"]["outdated"].append({
+                        findings["outdated"].append({
                             "package": name,
                             "current_version": version,
                             "latest_version": package.latest_release_number,
                             "severity": "medium",
                             "recommendation": f"Update to version {package.latest_release_number}"
                         })
-                        audit_results["summary"]["outdated_count"] += 1
-                
+
                 # Check security
                 security_result = await check_package_security(platform, name, version)
                 if security_result.success:
+                    security_issues = []
                     if security_result.data:
                         security_issues = security_result.data.get("security_issues", [])
                     for issue in security_issues:
-                        audit_results["audits"]["security"].append({
+                        findings["security"].append({
                             "package": name,
                             "version": version,
                             "issue": issue,
                             "severity": issue.get("severity", "medium"),
                             "recommendation": issue.get("description", "Review security concerns")
                         })
-                        audit_results["summary"]["security_issues_count"] += 1
-                
+
                 # Generate recommendations
                 if package.stars and package.stars < 10:
-                    audit_results["audits"]["recommendations"].append({
+                    findings["recommendations"].append({
                         "package": name,
                         "type": "low_popularity",
                         "severity": "low",
                         "recommendation": f"Consider alternatives - package has only {package.stars} stars"
                     })
-                    audit_results["summary"]["recommendations_count"] += 1
-                
+
                 if not package.repository_url:
-                    audit_results["audits"]["recommendations"].append({
+                    findings["recommendations"].append({
                         "package": name,
                         "type": "no_repository",
                         "severity": "low",
                         "recommendation": "Package has no repository URL - verify source"
                     })
-                    audit_results["summary"]["recommendations_count"] += 1
-                
+
             except LibrariesIOClientError as e:
-                audit_results["audits"]["recommendations"].append({
+                findings["recommendations"].append({
                     "package": name,
                     "type": "fetch_error",
                     "severity": "high",
                     "recommendation": f"Could not fetch package information: {str(e)}"
                 })
-                audit_results["summary"]["recommendations_count"] += 1
+
+            return findings
+
+        package_findings = await asyncio.gather(
+            *(audit_package(name, pkg_info) for name, pkg_info in package_registry.items())
+        )
+
+        # Merge findings in registry order so output stays deterministic
+        for findings in package_findings:
+            audit_results["audits"]["outdated"].extend(findings["outdated"])
+            audit_results["summary"]["outdated_count"] += len(findings["outdated"])
+            audit_results["audits"]["security"].extend(findings["security"])
+            audit_results["summary"]["security_issues_count"] += len(findings["security"])
+            audit_results["audits"]["recommendations"].extend(findings["recommendations"])
+            audit_results["summary"]["recommendations_count"] += len(findings["recommendations"])
         
         # Calculate overall project health score
         total_issues = (
@@ -1728,20 +1756,15 @@ async def audit_project_dependencies(
         audit_results["project_health_score"] = project_health
         audit_results["health_status"] = _get_health_status(project_health)
         
-        # Get rate limit info
-        rate_limit = client.get_rate_limit_info()
-        rate_limit_info = rate_limit.dict() if rate_limit else None
+        # Rate limit info is kept pre-serialized by the client
+        rate_limit_info = client.get_rate_limit_dict()
         
-        return ToolResponse(
-            success=True,
-            data=audit_results,
-            rate_limit_info=rate_limit_info
-        )
+        return _ok(audit_results, rate_limit_info)
         
     except LibrariesIOClientError as e:
-        return ToolResponse(success=False, error=str(e))
+        return _err(str(e))
     except Exception as e:
-        return ToolResponse(success=False, error=f"Unexpected error: {str(e)}")
+        return _err(f"Unexpected error: {str(e)}")
 
 
 def _get_health_status(score: int) -> str:
@@ -1780,8 +1803,9 @@ def register_tools(server, client: LibrariesIOClient) -> None:
         generate_dependency_report, audit_project_dependencies
     ]
     
+    _client_var.set(client)
+
     for tool in tools:
-        tool.__mcp_client__ = client
         server.add_tool(tool)
 
 
@@ -6,15 +6,15 @@ This module contains utility functions and helper classes.
 
 import asyncio
 import time
-import hashlib
 import json
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Hashable, Optional, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RateLimitInfo:
     """Rate limit information."""
     limit: int
@@ -43,42 +43,35 @@ class RateLimiter:
     async def acquire(self, tokens: int = 1) -> None:
         """
         Acquire tokens from the rate limiter.
-        
+
+        Tokens refill continuously at ``limit / window_seconds`` per second,
+        so accumulated credit is spent immediately instead of waiting for a
+        window boundary. Waiters sleep outside the lock so one sleeping
+        caller does not serialize everyone else.
+
         Args:
             tokens: Number of tokens to acquire
         """
-        async with self._lock:
-            now = time.time()
-            time_passed = now - self.last_refill
-            
-            # Refill tokens based on time passed
-            if time_passed >= self.window_seconds:
-                self.tokens = self.limit
-                self.last_refill = now
-            else:
-                # Calculate how many tokens to add
-                tokens_to_add = int((time_passed / self.window_seconds) * self.limit)
-                self.tokens = min(self.limit, self.tokens + tokens_to_add)
-                self.last_refill = now
-            
-            # Wait if we don't have enough tokens
-            while self.tokens < tokens:
-                sleep_time = self.window_seconds - time_passed + 1
-                await asyncio.sleep(sleep_time)
+        while True:
+            async with self._lock:
                 now = time.time()
                 time_passed = now - self.last_refill
-                
-                # Refill tokens
-                if time_passed >= self.window_seconds:
-                    self.tokens = self.limit
-                    self.last_refill = now
-                else:
-                    tokens_to_add = int((time_passed / self.window_seconds) * self.limit)
-                    self.tokens = min(self.limit, self.tokens + tokens_to_add)
-                    self.last_refill = now
-            
-            # Consume tokens
-            self.tokens -= tokens
+
+                # Refill tokens based on time passed
+                self.tokens = min(
+                    self.limit,
+                    self.tokens + (time_passed / self.window_seconds) * self.limit
+                )
+                self.last_refill = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                # Sleep exactly until the missing tokens have accrued
+                sleep_time = (tokens - self.tokens) * self.window_seconds / self.limit
+
+            await asyncio.sleep(sleep_time)
     
     def get_info(self) -> RateLimitInfo:
         """Get current rate limit information."""
@@ -103,6 +96,129 @@ class RateLimiter:
         )
 
 
+class TokenBucketRateLimiter:
+    """
+    Token bucket rate limiter with burst support and bounded concurrency.
+
+    Tokens refill continuously at ``limit / window_seconds`` per second, so
+    short bursts up to ``burst`` tokens are served immediately while the
+    sustained rate stays within the configured limit. Unlike
+    :class:`RateLimiter`, waiters sleep outside the internal lock, so
+    concurrent callers don't serialize behind a sleeping holder.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: int = 60,
+        burst: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize token bucket rate limiter.
+
+        Args:
+            limit: Maximum number of requests allowed in the window
+            window_seconds: Duration of the rate limit window in seconds
+            burst: Maximum burst size (defaults to limit)
+            max_concurrency: Maximum number of concurrent holders (optional)
+        """
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.rate = limit / window_seconds
+        self.capacity = burst if burst is not None else limit
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """
+        Acquire tokens from the bucket, sleeping until they are available.
+
+        Args:
+            tokens: Number of tokens to acquire
+        """
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last_refill) * self.rate
+                )
+                self.last_refill = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                wait_time = (tokens - self.tokens) / self.rate
+
+            # Sleep outside the lock so other callers can refill/acquire
+            await asyncio.sleep(wait_time)
+
+    async def __aenter__(self) -> "TokenBucketRateLimiter":
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+class FrequencySketch:
+    """
+    Count-Min Sketch of 4-bit saturating counters for TinyLFU admission.
+
+    Tracks approximate access frequency per key in constant space. Counters
+    are periodically halved so the sketch ages out stale popularity instead
+    of growing without bound.
+    """
+
+    _DEPTH = 4
+    _WIDTH = 2048  # power of two so indexing is a cheap mask
+
+    def __init__(self, sample_size: int):
+        """
+        Initialize frequency sketch.
+
+        Args:
+            sample_size: Number of increments before counters are halved
+        """
+        self._tables = [[0] * self._WIDTH for _ in range(self._DEPTH)]
+        self._mask = self._WIDTH - 1
+        self._sample_size = sample_size
+        self._additions = 0
+
+    def increment(self, key: Hashable) -> None:
+        """Record one access to key."""
+        for i, row in enumerate(self._tables):
+            index = hash((i, key)) & self._mask
+            if row[index] < 15:
+                row[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def estimate(self, key: Hashable) -> int:
+        """Estimate how often key has been accessed."""
+        return min(
+            row[hash((i, key)) & self._mask]
+            for i, row in enumerate(self._tables)
+        )
+
+    def _age(self) -> None:
+        """Halve all counters so old popularity decays."""
+        for row in self._tables:
+            for index, count in enumerate(row):
+                if count:
+                    row[index] = count >> 1
+        self._additions //= 2
+
+
 class CacheEntry:
     """Cache entry with expiration."""
     
@@ -120,30 +236,38 @@ class CacheEntry:
 
 
 class MemoryCache:
-    """In-memory cache with TTL support."""
-    
+    """
+    In-memory cache with TTL support and TinyLFU admission.
+
+    Eviction uses least-recently-used order, but a new entry only displaces
+    the LRU victim when the frequency sketch says it is accessed more often.
+    This keeps one-shot lookups from flushing the hot working set, which
+    matters for API-response caching where package popularity is heavily
+    skewed.
+    """
+
     def __init__(self, default_ttl: int = 300, max_size: int = 1000):
         """
         Initialize memory cache.
-        
+
         Args:
             default_ttl: Default time to live in seconds
             max_size: Maximum number of cache entries
         """
         self.default_ttl = default_ttl
         self.max_size = max_size
-        self._cache: Dict[str, CacheEntry] = {}
-        self._access_times: Dict[str, float] = {}
+        self._cache: Dict[Hashable, CacheEntry] = {}
+        self._access_times: Dict[Hashable, float] = {}
+        self._sketch = FrequencySketch(sample_size=max_size * 10)
         self._lock = asyncio.Lock()
     
     def _generate_key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
         """Generate cache key from endpoint and parameters."""
-        key_data = {
-            'endpoint': endpoint,
-            'params': params or {}
-        }
-        key_string = json.dumps(key_data, sort_keys=True)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        # The cache is in-process, so the key only needs to be a stable
+        # dict key — the structural repr serves directly, with no digest
+        # step at all.
+        items = tuple(sorted(params.items())) if params else ()
+        return repr((endpoint, items))
     
     async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
         """
@@ -153,28 +277,44 @@ class MemoryCache:
             endpoint: API endpoint
             params: Request parameters
             
+        Returns:
+            Cached data or None if not found or expired
+        """
+        return await self.get_by_key(self._generate_key(endpoint, params))
+
+    async def get_by_key(self, key: Hashable) -> Optional[Any]:
+        """
+        Get cached data by a precomputed key.
+
+        Lets callers that already hold a key (e.g. to pair a get with a
+        later set) skip recomputing it. Any hashable key works; tuples
+        avoid serialization and hashing entirely.
+
+        Args:
+            key: Precomputed cache key
+
         Returns:
             Cached data or None if not found or expired
         """
         async with self._lock:
-            key = self._generate_key(endpoint, params)
-            
+            self._sketch.increment(key)
+
             if key not in self._cache:
                 return None
-            
+
             entry = self._cache[key]
-            
+
             if entry.is_expired():
                 # Remove expired entry
                 del self._cache[key]
                 if key in self._access_times:
                     del self._access_times[key]
                 return None
-            
+
             # Update access time
             self._access_times[key] = time.time()
             return entry.data
-    
+
     async def set(self, endpoint: str, params: Optional[Dict[str, Any]], data: Any, ttl: Optional[int] = None) -> None:
         """
         Set cached data.
@@ -185,27 +325,34 @@ class MemoryCache:
             data: Data to cache
             ttl: Time to live in seconds (uses default if None)
         """
+        await self.set_by_key(self._generate_key(endpoint, params), data, ttl)
+
+    async def set_by_key(self, key: Hashable, data: Any, ttl: Optional[int] = None) -> None:
+        """
+        Set cached data by a precomputed key.
+
+        Args:
+            key: Precomputed cache key
+            data: Data to cache
+            ttl: Time to live in seconds (uses default if None)
+        """
         async with self._lock:
-            key = self._generate_key(endpoint, params)
-            
-            # Check if we need to evict entries
-            if len(self._cache) >= self.max_size:
-                await self._evict_oldest()
-            
+            self._sketch.increment(key)
+
+            # When full, only admit the new entry if it is more frequent
+            # than the LRU victim it would displace (TinyLFU admission)
+            if key not in self._cache and len(self._cache) >= self.max_size:
+                victim = min(self._access_times.items(), key=lambda x: x[1])[0]
+                if self._sketch.estimate(key) <= self._sketch.estimate(victim):
+                    return
+                del self._cache[victim]
+                del self._access_times[victim]
+
             # Set cache entry
             expires_at = time.time() + (ttl or self.default_ttl)
             self._cache[key] = CacheEntry(data, expires_at)
             self._access_times[key] = time.time()
     
-    async def _evict_oldest(self) -> None:
-        """Evict the oldest cache entry."""
-        if not self._access_times:
-            return
-        
-        oldest_key = min(self._access_times.items(), key=lambda x: x[1])[0]
-        del self._cache[oldest_key]
-        del self._access_times[oldest_key]
-    
     async def clear(self) -> None:
         """Clear all cached data."""
         async with self._lock:
@@ -355,58 +502,82 @@ async def timeout_context(timeout_seconds: float):
         raise asyncio.TimeoutError(f"Operation timed out after {timeout_seconds} seconds")
 
 
+# Common package manager platforms; module-level frozenset so validation is
+# a single constant-time lookup with no per-call set construction
+VALID_PLATFORMS = frozenset({
+    'npm', 'pypi', 'maven', 'gem', 'nuget', 'docker', 'hex', 'cran',
+    'hackage', 'packagist', 'cocoapods', 'bower', 'composer', 'go',
+    'elm', 'pub', 'dart', 'conan', 'bitbucket', 'github', 'gitlab'
+})
+
+
+@lru_cache(maxsize=256)
 def validate_platform(platform: str) -> bool:
     """
     Validate platform name.
-    
+
     Args:
         platform: Platform name
-        
+
     Returns:
         True if platform is valid
     """
-    # Common package manager platforms
-    valid_platforms = {
-        'npm', 'pypi', 'maven', 'gem', 'nuget', 'docker', 'hex', 'cran',
-        'hackage', 'packagist', 'cocoapods', 'bower', 'composer', 'go',
-        'elm', 'pub', 'dart', 'conan', 'bitbucket', 'github', 'gitlab'
-    }
-    return platform.lower() in valid_platforms
+    return platform.lower() in VALID_PLATFORMS
 
 
+@lru_cache(maxsize=4096)
 def sanitize_package_name(name: str) -> str:
     """
     Sanitize package name for API requests.
-    
+
+    Both helpers are pure functions over small strings, and dependency-tree
+    walks hit the same package names over and over, so memoizing them turns
+    repeat calls into a dict lookup.
+
     Args:
         name: Package name
-        
+
     Returns:
         Sanitized package name
     """
     # Remove leading/trailing whitespace
     name = name.strip()
-    
+
     # Replace multiple spaces with single space
     name = ' '.join(name.split())
-    
+
     return name
 
 
-# Global instances (can be overridden)
-default_rate_limiter = RateLimiter(60, 60)  # 60 requests per 60 seconds
-default_cache = MemoryCache(300, 1000)  # 5 minute TTL, 1000 max entries
-default_retry_handler = RetryHandler(3, 1.0, 60.0)  # 3 retries, exponential backoff
+# Global instances (can be overridden), constructed lazily on first access
+# via module __getattr__ so importing this module stays cheap for callers
+# that never use them
+_DEFAULT_FACTORIES = {
+    'default_rate_limiter': lambda: RateLimiter(60, 60),  # 60 requests per 60 seconds
+    'default_cache': lambda: MemoryCache(300, 1000),  # 5 minute TTL, 1000 max entries
+    'default_retry_handler': lambda: RetryHandler(3, 1.0, 60.0),  # 3 retries, exponential backoff
+}
+
+
+def __getattr__(name: str) -> Any:
+    factory = _DEFAULT_FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    instance = globals()[name] = factory()
+    return instance
 
 
 __all__ = [
     "RateLimitInfo",
-    "RateLimiter", 
+    "RateLimiter",
+    "TokenBucketRateLimiter",
+    "FrequencySketch",
     "CacheEntry",
     "MemoryCache",
     "RetryHandler",
     "HTTPClientHelper",
     "timeout_context",
+    "VALID_PLATFORMS",
     "validate_platform",
     "sanitize_package_name",
     "default_rate_limiter",
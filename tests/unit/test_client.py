@@ -450,11 +450,62 @@ class TestLibrariesIOClient:
         mock_retry_handler.retry.return_value = mock_response
         
         result = await client.get_package_dependencies('npm', 'react')
-        
+
         assert len(result) > 0
         assert isinstance(result[0], Dependency)
         assert result[0].project.name == 'react'
 
+    @pytest.mark.asyncio
+    async def test_get_many_dependencies_preserves_order(self, client):
+        """Test get_many_dependencies returns results in input order."""
+        deps = {
+            ('npm', 'react'): [Dependency(name='loose-envify', platform='npm', requirement='*')],
+            ('npm', 'vue'): [],
+            ('pypi', 'requests'): [Dependency(name='urllib3', platform='pypi', requirement='*')]
+        }
+        client.get_package_dependencies = AsyncMock(
+            side_effect=lambda platform, name: deps[(platform, name)]
+        )
+
+        result = await client.get_many_dependencies(
+            [('npm', 'react'), ('npm', 'vue'), ('pypi', 'requests')]
+        )
+
+        assert [[dep.name for dep in item] for item in result] == [
+            ['loose-envify'], [], ['urllib3']
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_many_dependencies_passes_version(self, client):
+        """Test three-element items forward the version to the fetch."""
+        client.get_package_dependencies = AsyncMock(return_value=[])
+
+        await client.get_many_dependencies([('npm', 'react', '18.0.0')])
+
+        client.get_package_dependencies.assert_awaited_once_with('npm', 'react', '18.0.0')
+
+    @pytest.mark.asyncio
+    async def test_get_many_dependencies_bounds_concurrency(self, client):
+        """Test no more than max_concurrency fetches run at once."""
+        active = 0
+        peak = 0
+
+        async def fetch(platform, name):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return []
+
+        client.get_package_dependencies = AsyncMock(side_effect=fetch)
+
+        await client.get_many_dependencies(
+            [('npm', f'pkg-{i}') for i in range(10)], max_concurrency=3
+        )
+
+        assert peak <= 3
+
     @pytest.mark.asyncio
     async def test_get_package_dependents_success(self, client, mock_cache, mock_rate_limiter, mock_retry_handler):
         """Test successful package dependents request."""
@@ -466,11 +517,50 @@ class TestLibrariesIOClient:
         mock_retry_handler.retry.return_value = mock_response
         
         result = await client.get_package_dependents('npm', 'react')
-        
+
         assert len(result) > 0
         assert isinstance(result[0], Package)
         assert result[0].name == 'some-dependent'
 
+    @pytest.mark.asyncio
+    async def test_iter_dependents_short_first_page_costs_one_request(self, client):
+        """Test iter_dependents issues a single request when page 1 is short."""
+        pages = {1: [Package(name='only-dependent', platform='npm')]}
+        client.get_package_dependents = AsyncMock(
+            side_effect=lambda platform, name, page, per_page: pages.get(page, [])
+        )
+
+        result = [pkg async for pkg in client.iter_dependents('npm', 'react', per_page=2)]
+
+        assert [pkg.name for pkg in result] == ['only-dependent']
+        client.get_package_dependents.assert_awaited_once_with(
+            'npm', 'react', page=1, per_page=2
+        )
+
+    @pytest.mark.asyncio
+    async def test_iter_dependents_fans_out_after_full_probe(self, client):
+        """Test iter_dependents fetches later pages only after a full page 1."""
+        pages = {
+            1: [Package(name='dep-1', platform='npm'), Package(name='dep-2', platform='npm')],
+            2: [Package(name='dep-3', platform='npm'), Package(name='dep-4', platform='npm')],
+            3: [Package(name='dep-5', platform='npm')]
+        }
+        client.get_package_dependents = AsyncMock(
+            side_effect=lambda platform, name, page, per_page: pages.get(page, [])
+        )
+
+        result = [
+            pkg async for pkg in
+            client.iter_dependents('npm', 'react', per_page=2, max_concurrency=2)
+        ]
+
+        # All dependents in page order, stopping at the first short page
+        assert [pkg.name for pkg in result] == ['dep-1', 'dep-2', 'dep-3', 'dep-4', 'dep-5']
+        requested_pages = [
+            call.kwargs['page'] for call in client.get_package_dependents.await_args_list
+        ]
+        assert requested_pages == [1, 2, 3]
+
     @pytest.mark.asyncio
     async def test_search_packages_success(self, client, mock_cache, mock_rate_limiter, mock_retry_handler):
         """Test successful search packages request."""
@@ -0,0 +1,76 @@
+"""
+Unit tests for the Libraries.io resources.
+
+This module contains unit tests for resource URI parsing.
+"""
+
+import dataclasses
+
+import pytest
+
+from src.libraries_io_mcp.resources import ParsedURI, parse_resource_uri
+
+
+class TestParseResourceURI:
+    """Test suite for parse_resource_uri and ParsedURI."""
+
+    def test_parse_package_uri(self):
+        """Test parsing a packages:// URI."""
+        parsed = parse_resource_uri("packages://npm/react/info")
+
+        assert isinstance(parsed, ParsedURI)
+        assert parsed.scheme == "packages"
+        assert parsed.netloc == "npm"
+        assert parsed.path == "react/info"
+        assert parsed.resource_type == "info"
+
+    def test_parse_platform_uri(self):
+        """Test parsing a platforms:// URI."""
+        parsed = parse_resource_uri("platforms://npm/stats")
+
+        assert parsed.scheme == "platforms"
+        assert parsed.netloc == "npm"
+        assert parsed.resource_type == "stats"
+
+    def test_parse_user_uri(self):
+        """Test parsing a users:// URI."""
+        parsed = parse_resource_uri("users://octocat/packages")
+
+        assert parsed.scheme == "users"
+        assert parsed.username == "octocat"
+        assert parsed.resource_type == "packages"
+
+    def test_parse_org_uri(self):
+        """Test parsing an orgs:// URI."""
+        parsed = parse_resource_uri("orgs://facebook/packages")
+
+        assert parsed.scheme == "orgs"
+        assert parsed.org == "facebook"
+        assert parsed.resource_type == "packages"
+
+    def test_parse_query_params(self):
+        """Test query parameters are parsed into a hashable tuple."""
+        parsed = parse_resource_uri("search://packages?q=react&page=2")
+
+        assert parsed.scheme == "search"
+        assert parsed.netloc == "packages"
+        assert parsed.params == (("q", ("react",)), ("page", ("2",)))
+
+    def test_parse_invalid_uri(self):
+        """Test an unparseable URI raises ValueError."""
+        with pytest.raises(ValueError, match="Failed to parse URI"):
+            parse_resource_uri(None)
+
+    def test_parsed_uri_is_cached(self):
+        """Test repeated parses of the same URI share one ParsedURI."""
+        first = parse_resource_uri("packages://npm/react/info")
+        second = parse_resource_uri("packages://npm/react/info")
+
+        assert first is second
+
+    def test_parsed_uri_is_frozen(self):
+        """Test the shared ParsedURI cannot be mutated by callers."""
+        parsed = parse_resource_uri("packages://npm/react/info")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            parsed.scheme = "other"
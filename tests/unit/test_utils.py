@@ -11,9 +11,10 @@ from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timezone, timedelta
 
 from src.libraries_io_mcp.utils import (
-    RateLimitInfo, RateLimiter, CacheEntry, MemoryCache, 
-    RetryHandler, HTTPClientHelper, validate_platform, 
-    sanitize_package_name, default_rate_limiter, 
+    RateLimitInfo, RateLimiter, TokenBucketRateLimiter,
+    FrequencySketch, CacheEntry, MemoryCache,
+    RetryHandler, HTTPClientHelper, validate_platform,
+    sanitize_package_name, default_rate_limiter,
     default_cache, default_retry_handler
 )
 from tests.test_utils import MockDataGenerator, TestMockHelpers, TestAssertionHelpers
@@ -144,6 +145,99 @@ class TestRateLimiter:
         assert info.used == 10
 
 
+class TestTokenBucketRateLimiter:
+    """Test suite for TokenBucketRateLimiter class."""
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_initialization(self):
+        """Test TokenBucketRateLimiter initialization."""
+        limiter = TokenBucketRateLimiter(limit=60, window_seconds=60)
+
+        assert limiter.limit == 60
+        assert limiter.rate == 1.0
+        assert limiter.capacity == 60
+        assert limiter.tokens == 60.0
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_custom_burst(self):
+        """Test burst caps the bucket capacity."""
+        limiter = TokenBucketRateLimiter(limit=60, window_seconds=60, burst=10)
+
+        assert limiter.capacity == 10
+        assert limiter.tokens == 10.0
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_burst_acquires_immediately(self):
+        """Test acquisitions within the burst do not sleep."""
+        limiter = TokenBucketRateLimiter(limit=10, window_seconds=60)
+
+        start = time.monotonic()
+        for _ in range(10):
+            await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5
+        assert limiter.tokens < 1.0
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_waits_when_empty(self):
+        """Test acquire sleeps until tokens refill once the bucket is drained."""
+        # 20 tokens/second so the forced wait stays short
+        limiter = TokenBucketRateLimiter(limit=20, window_seconds=1, burst=1)
+
+        await limiter.acquire()
+        start = time.monotonic()
+        await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # Second acquire had to wait for ~1/20s of refill
+        assert elapsed >= 0.02
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_context_manager(self):
+        """Test async context manager acquires a token per entry."""
+        limiter = TokenBucketRateLimiter(limit=10, window_seconds=60, max_concurrency=2)
+
+        async with limiter:
+            pass
+
+        assert limiter.tokens < 10.0
+
+
+class TestFrequencySketch:
+    """Test suite for FrequencySketch class."""
+
+    def test_frequency_sketch_estimate_counts_increments(self):
+        """Test estimate reflects the number of increments for a key."""
+        sketch = FrequencySketch(sample_size=1000)
+
+        for _ in range(3):
+            sketch.increment("hot-key")
+
+        assert sketch.estimate("hot-key") == 3
+        assert sketch.estimate("unseen-key") == 0
+
+    def test_frequency_sketch_counters_saturate(self):
+        """Test counters stop at the 4-bit maximum instead of overflowing."""
+        sketch = FrequencySketch(sample_size=1000)
+
+        for _ in range(40):
+            sketch.increment("hot-key")
+
+        assert sketch.estimate("hot-key") == 15
+
+    def test_frequency_sketch_aging_halves_counters(self):
+        """Test counters are halved once sample_size increments are recorded."""
+        sketch = FrequencySketch(sample_size=10)
+
+        for _ in range(10):
+            sketch.increment("hot-key")
+
+        # The 10th increment triggers aging: 10 accesses decay to 5
+        assert sketch.estimate("hot-key") == 5
+        assert sketch._additions == 5
+
+
 class TestCacheEntry:
     """Test suite for CacheEntry class."""
     
@@ -305,7 +399,41 @@ class TestMemoryCache:
         # Check that cache size is still max size
         size = await memory_cache.size()
         assert size == memory_cache.max_size
-    
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_admission_rejects_cold_key(self):
+        """Test a one-shot key is not admitted over an established entry."""
+        cache = MemoryCache(default_ttl=300, max_size=2)
+
+        await cache.set_by_key("a", "data_a")
+        await cache.set_by_key("b", "data_b")
+
+        # A cold key seen once is no more frequent than the LRU victim,
+        # so TinyLFU admission keeps the existing working set
+        await cache.set_by_key("c", "data_c")
+
+        assert await cache.get_by_key("c") is None
+        assert await cache.get_by_key("a") == "data_a"
+        assert await cache.get_by_key("b") == "data_b"
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_admission_admits_hot_key(self):
+        """Test a frequently requested key displaces the LRU victim."""
+        cache = MemoryCache(default_ttl=300, max_size=2)
+
+        await cache.set_by_key("a", "data_a")
+        await cache.set_by_key("b", "data_b")
+
+        # Repeated lookups (even misses) raise the key's frequency estimate
+        for _ in range(3):
+            await cache.get_by_key("c")
+
+        await cache.set_by_key("c", "data_c")
+
+        assert await cache.get_by_key("c") == "data_c"
+        assert await cache.get_by_key("a") is None  # LRU victim evicted
+        assert await cache.size() == 2
+
     @pytest.mark.asyncio
     async def test_memory_cache_generate_key(self, memory_cache):
         """Test cache key generation."""